@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Interactive CLI demo for the Chess Tutor."""
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -10,7 +11,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 
 from src.agents.tutor_orchestrator import TutorOrchestrator
-from src.utils.config import settings
+from src.utils.config import get_settings
+from src.utils.schemas import CLASSIFICATION_LABELS
+
+
+# Display emoji per move classification
+_EVAL_EMOJI = {
+    "brilliant": "💎",
+    "great": "⭐",
+    "best": "✅",
+    "excellent": "👍",
+    "good": "👌",
+    "inaccuracy": "⚠️",
+    "mistake": "❌",
+    "blunder": "💀",
+    "book": "📖",
+}
+# Full "Move Quality" line per classification, built once at import
+_QUALITY_LINES = {
+    c: f"Move Quality: {emoji} {CLASSIFICATION_LABELS[c]}"
+    for c, emoji in _EVAL_EMOJI.items()
+}
 
 
 def print_header():
@@ -28,10 +49,14 @@ def print_header():
     print("=" * 60 + "\n")
 
 
+def format_board(orchestrator: TutorOrchestrator) -> str:
+    """Format the current board and FEN for display."""
+    return f"\n{orchestrator.get_board_display()}\nFEN: {orchestrator.current_fen}\n\n"
+
+
 def print_board(orchestrator: TutorOrchestrator):
     """Print the current board."""
-    print("\n" + orchestrator.get_board_display())
-    print(f"FEN: {orchestrator.current_fen}\n")
+    sys.stdout.write(format_board(orchestrator))
 
 
 def print_status(orchestrator: TutorOrchestrator):
@@ -49,28 +74,22 @@ def print_status(orchestrator: TutorOrchestrator):
     print()
 
 
-def format_tutor_response(plan, is_move_mode: bool) -> str:
-    """Format tutor plan for display."""
+def format_tutor_response(plan, show_explain: bool = True) -> str:
+    """
+    Format tutor plan for display as one ready-to-write buffer.
+
+    The explanation (and its "Tutor:" prefix) is omitted if it was already
+    streamed to the terminal.
+    """
     lines = []
 
     # Move evaluation - only show in move mode
-    if is_move_mode and plan.move_evaluation:
-        eval_emoji = {
-            "brilliant": "💎",
-            "great": "⭐",
-            "best": "✅",
-            "excellent": "👍",
-            "good": "👌",
-            "inaccuracy": "⚠️",
-            "mistake": "❌",
-            "blunder": "💀",
-            "book": "📖",
-        }
-        emoji = eval_emoji.get(plan.move_evaluation.value, "")
-        lines.append(f"Move Quality: {emoji} {plan.move_evaluation.value.upper()}")
+    if plan.mode == "move" and plan.move_evaluation:
+        lines.append(_QUALITY_LINES[plan.move_evaluation])
 
     # Explanation
-    lines.append(f"\n{plan.explain}")
+    if show_explain:
+        lines.append(f"\n{plan.explain}")
 
     # Tutor's move - only in move mode
     if plan.opponent_reply:
@@ -86,10 +105,64 @@ def format_tutor_response(plan, is_move_mode: bool) -> str:
 
     # Grounding (debug info)
     if plan.grounding_citations:
-        citation = plan.grounding_citations[0]
-        lines.append(f"\n📊 Analysis: {citation[:80]}...")
+        lines.append(f"\n📊 Analysis: {plan.grounding_citations[0]}")
+
+    prefix = "\nTutor: " if show_explain else ""
+    return "".join((prefix, "\n".join(lines), "\n\n"))
+
+
+def new_game(orchestrator: TutorOrchestrator):
+    """Start a new game and show the fresh board."""
+    orchestrator.reset_game()
+    print("\n--- New Game Started ---")
+    print(f"New Thread ID: {orchestrator.thread_id}\n")
+    print_board(orchestrator)
+
+
+def quit_session(orchestrator: TutorOrchestrator) -> bool:
+    """Say goodbye; returns True to end the session loop."""
+    print("\nThanks for playing! Goodbye. ♔")
+    return True
+
+
+# Command word -> handler(orchestrator); a truthy return ends the session
+COMMANDS = {
+    "board": print_board,
+    "status": print_status,
+    "new": new_game,
+    "quit": quit_session,
+    "exit": quit_session,
+    "q": quit_session,
+}
+
+# Longer inputs can't be commands, so they skip lowercasing entirely
+_MAX_COMMAND_LEN = max(map(len, COMMANDS))
+
+
+async def stream_turn(orchestrator: TutorOrchestrator, user_input: str):
+    """
+    Run one turn, printing the explanation as it streams in.
+
+    Returns:
+        Tuple of (final TutorPlan, whether any explanation text was streamed)
+    """
+    plan = None
+    streamed = False
 
-    return "\n".join(lines)
+    async for delta in orchestrator.process_turn_stream(user_input):
+        if delta.mode:
+            print(f"[{delta.mode.upper()} MODE]")
+        if delta.text:
+            if not streamed:
+                print("\nTutor: ", end="")
+                streamed = True
+            print(delta.text, end="", flush=True)
+        if delta.plan is not None:
+            plan = delta.plan
+
+    if streamed:
+        print()
+    return plan, streamed
 
 
 def select_level() -> str:
@@ -112,10 +185,16 @@ def select_level() -> str:
 
 def main():
     """Run the interactive chess tutor demo."""
+    asyncio.run(amain())
+
+
+async def amain():
+    """Interactive session loop (async so tutor replies can stream)."""
     # Load environment variables
     load_dotenv()
 
     # Check API key
+    settings = get_settings()
     if not settings.validate_api_key():
         print("\n⚠️  ERROR: OpenAI API key not configured!")
         print("Please set OPENAI_API_KEY in your .env file or environment.")
@@ -156,6 +235,7 @@ def main():
     try:
         while True:
             try:
+                # Blocking input is fine here: nothing else runs between turns
                 user_input = input("You: ").strip()
             except EOFError:
                 break
@@ -163,50 +243,29 @@ def main():
             if not user_input:
                 continue
 
-            # Handle commands
-            lower_input = user_input.lower()
-
-            if lower_input in ("quit", "exit", "q"):
-                print("\nThanks for playing! Goodbye. ♔")
-                break
-
-            if lower_input == "board":
-                print_board(orchestrator)
-                continue
-
-            if lower_input == "status":
-                print_status(orchestrator)
-                continue
-
-            if lower_input == "new":
-                orchestrator.reset_game()
-                print("\n--- New Game Started ---")
-                print(f"New Thread ID: {orchestrator.thread_id}\n")
-                print_board(orchestrator)
+            # Handle commands (moves and chat are passed through untouched)
+            if len(user_input) <= _MAX_COMMAND_LEN and (
+                handler := COMMANDS.get(user_input.lower())
+            ):
+                if handler(orchestrator):
+                    break
                 continue
 
             # Process turn
             print("\nTutor: (thinking...)")
             try:
-                # Store FEN before to detect if move was made
-                fen_before = orchestrator.current_fen
+                plan, streamed = await stream_turn(orchestrator, user_input)
 
-                plan = orchestrator.process_turn(user_input)
+                # The orchestrator tags each plan with the mode it ran in
+                is_move_mode = plan.mode == "move"
 
-                # Detect mode: if FEN changed or opponent replied, it was move mode
-                is_move_mode = (orchestrator.current_fen != fen_before) or (plan.opponent_reply is not None)
-
-                if is_move_mode:
-                    print("[MOVE MODE]")
-                else:
-                    print("[CHAT MODE]")
-
-                response = format_tutor_response(plan, is_move_mode)
-                print(f"\nTutor: {response}\n")
+                output = format_tutor_response(plan, show_explain=not streamed)
 
                 # Show board after moves (only in move mode)
                 if is_move_mode:
-                    print_board(orchestrator)
+                    output += format_board(orchestrator)
+
+                sys.stdout.write(output)
 
                 # Check for game over
                 status = orchestrator.get_game_status()
@@ -219,6 +278,8 @@ def main():
                 print(f"\nTutor: I encountered an error: {e}")
                 print("       Please try again or type 'new' to restart.\n")
 
+            sys.stdout.flush()
+
     finally:
         # Clean up
         orchestrator.close()
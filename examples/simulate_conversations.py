@@ -7,8 +7,11 @@ x-run-id tracing data via vLLora gateway for RL fine-tuning.
 """
 
 import argparse
+import asyncio
+import logging
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -16,225 +19,253 @@ from typing import Optional
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import orjson
 from dotenv import load_dotenv
 
 from src.agents.tutor_orchestrator import TutorOrchestrator
-from src.utils.config import settings
+from src.services.stockfish_service import StockfishPool
+from src.utils.config import get_settings
 
 
-@dataclass
+log = logging.getLogger("chess_tutor.sim")
+_RULE = "=" * 70
+
+@dataclass(frozen=True, slots=True)
 class ConversationScenario:
     """A predefined conversation scenario with moves and chat."""
     name: str
     skill_level: str
-    user_inputs: list[str]
+    user_inputs: tuple[str, ...]
     description: str
 
 
-def create_scenarios() -> list[ConversationScenario]:
-    """Create diverse conversation scenarios with varied openings and interactions."""
-
-    scenarios = [
-        # Scenario 1: King's Pawn Opening - Beginner
-        ConversationScenario(
-            name="King's Pawn Opening - Beginner",
-            skill_level="beginner",
-            description="e4 opening with basic tactical questions",
-            user_inputs=[
-                "e4",
-                "Nf3",
-                "Why is developing knights early important?",
-                "d4",
-                "Bd3",
-                "What should I be thinking about now?",
-                "O-O",
-                "c3",
-                "How do I create an attack?",
-                "Re1",
-            ],
+# Diverse conversation scenarios with varied openings and interactions.
+# Immutable so the same objects can be shared freely (scenario selection,
+# worker processes, tests) without rebuilding them.
+SCENARIOS: tuple[ConversationScenario, ...] = (
+    # Scenario 1: King's Pawn Opening - Beginner
+    ConversationScenario(
+        name="King's Pawn Opening - Beginner",
+        skill_level="beginner",
+        description="e4 opening with basic tactical questions",
+        user_inputs=(
+            "e4",
+            "Nf3",
+            "Why is developing knights early important?",
+            "d4",
+            "Bd3",
+            "What should I be thinking about now?",
+            "O-O",
+            "c3",
+            "How do I create an attack?",
+            "Re1",
         ),
-
-        # Scenario 2: Queen's Pawn - Intermediate
-        ConversationScenario(
-            name="Queen's Pawn Defense - Intermediate",
-            skill_level="intermediate",
-            description="d4 opening with positional questions",
-            user_inputs=[
-                "d4",
-                "c4",
-                "What's the main idea behind this Queen's Gambit approach?",
-                "Nc3",
-                "Nf3",
-                "How should I evaluate the pawn structure here?",
-                "e3",
-                "Bd3",
-                "What are my key strategic goals in this position?",
-            ],
+    ),
+
+    # Scenario 2: Queen's Pawn - Intermediate
+    ConversationScenario(
+        name="Queen's Pawn Defense - Intermediate",
+        skill_level="intermediate",
+        description="d4 opening with positional questions",
+        user_inputs=(
+            "d4",
+            "c4",
+            "What's the main idea behind this Queen's Gambit approach?",
+            "Nc3",
+            "Nf3",
+            "How should I evaluate the pawn structure here?",
+            "e3",
+            "Bd3",
+            "What are my key strategic goals in this position?",
         ),
-
-        # Scenario 3: Reti Opening - Advanced
-        ConversationScenario(
-            name="Reti Opening - Advanced",
-            skill_level="advanced",
-            description="Nf3 hypermodern opening with deep strategic analysis",
-            user_inputs=[
-                "Nf3",
-                "g3",
-                "Can you analyze the imbalances in this hypermodern setup?",
-                "Bg2",
-                "O-O",
-                "What are the critical pawn breaks I should be considering?",
-                "d3",
-                "c4",
-                "How does this compare to traditional d4 systems?",
-            ],
+    ),
+
+    # Scenario 3: Reti Opening - Advanced
+    ConversationScenario(
+        name="Reti Opening - Advanced",
+        skill_level="advanced",
+        description="Nf3 hypermodern opening with deep strategic analysis",
+        user_inputs=(
+            "Nf3",
+            "g3",
+            "Can you analyze the imbalances in this hypermodern setup?",
+            "Bg2",
+            "O-O",
+            "What are the critical pawn breaks I should be considering?",
+            "d3",
+            "c4",
+            "How does this compare to traditional d4 systems?",
         ),
-
-        # Scenario 4: English Opening - Intermediate
-        ConversationScenario(
-            name="English Opening - Intermediate",
-            skill_level="intermediate",
-            description="c4 flank opening with strategy questions",
-            user_inputs=[
-                "c4",
-                "Nc3",
-                "What's the strategic difference between c4 and e4?",
-                "g3",
-                "Bg2",
-                "What should I know about this fianchetto structure?",
-                "Nf3",
-                "d3",
-                "How flexible is my position right now?",
-            ],
+    ),
+
+    # Scenario 4: English Opening - Intermediate
+    ConversationScenario(
+        name="English Opening - Intermediate",
+        skill_level="intermediate",
+        description="c4 flank opening with strategy questions",
+        user_inputs=(
+            "c4",
+            "Nc3",
+            "What's the strategic difference between c4 and e4?",
+            "g3",
+            "Bg2",
+            "What should I know about this fianchetto structure?",
+            "Nf3",
+            "d3",
+            "How flexible is my position right now?",
         ),
-
-        # Scenario 5: King's Gambit - Beginner
-        ConversationScenario(
-            name="King's Gambit - Beginner",
-            skill_level="beginner",
-            description="f4 gambit with tactical focus",
-            user_inputs=[
-                "e4",
-                "f4",
-                "Is this pawn sacrifice safe?",
-                "Nf3",
-                "Bc4",
-                "What am I trying to achieve with this opening?",
-                "d4",
-                "O-O",
-                "Should I be worried about my king?",
-            ],
+    ),
+
+    # Scenario 5: King's Gambit - Beginner
+    ConversationScenario(
+        name="King's Gambit - Beginner",
+        skill_level="beginner",
+        description="f4 gambit with tactical focus",
+        user_inputs=(
+            "e4",
+            "f4",
+            "Is this pawn sacrifice safe?",
+            "Nf3",
+            "Bc4",
+            "What am I trying to achieve with this opening?",
+            "d4",
+            "O-O",
+            "Should I be worried about my king?",
         ),
-
-        # Scenario 6: Mixed Strategy - Advanced
-        ConversationScenario(
-            name="Positional e4 Game - Advanced",
-            skill_level="advanced",
-            description="Strategic e4 game with complex questions",
-            user_inputs=[
-                "e4",
-                "d3",
-                "Why choose d3 over d4 here?",
-                "Nd2",
-                "Ngf3",
-                "Evaluate the knight positioning and pawn tension.",
-                "g3",
-                "Bg2",
-                "What are the key squares to control in this structure?",
-                "O-O",
-            ],
+    ),
+
+    # Scenario 6: Mixed Strategy - Advanced
+    ConversationScenario(
+        name="Positional e4 Game - Advanced",
+        skill_level="advanced",
+        description="Strategic e4 game with complex questions",
+        user_inputs=(
+            "e4",
+            "d3",
+            "Why choose d3 over d4 here?",
+            "Nd2",
+            "Ngf3",
+            "Evaluate the knight positioning and pawn tension.",
+            "g3",
+            "Bg2",
+            "What are the key squares to control in this structure?",
+            "O-O",
         ),
-
-        # Scenario 7: Quick Development - Intermediate
-        ConversationScenario(
-            name="Italian Game Development - Intermediate",
-            skill_level="intermediate",
-            description="Classical development with tactical opportunities",
-            user_inputs=[
-                "e4",
-                "Nf3",
-                "What's the plan after developing the knight?",
-                "Bc4",
-                "Nc3",
-                "How do I decide between aggressive and quiet play?",
-                "d3",
-                "Be3",
-                "What tactical patterns should I watch for?",
-            ],
+    ),
+
+    # Scenario 7: Quick Development - Intermediate
+    ConversationScenario(
+        name="Italian Game Development - Intermediate",
+        skill_level="intermediate",
+        description="Classical development with tactical opportunities",
+        user_inputs=(
+            "e4",
+            "Nf3",
+            "What's the plan after developing the knight?",
+            "Bc4",
+            "Nc3",
+            "How do I decide between aggressive and quiet play?",
+            "d3",
+            "Be3",
+            "What tactical patterns should I watch for?",
         ),
-
-        # Scenario 8: London System - Beginner
-        ConversationScenario(
-            name="London System - Beginner",
-            skill_level="beginner",
-            description="Solid d4 system with fundamental questions",
-            user_inputs=[
-                "d4",
-                "Nf3",
-                "What makes the London System good for beginners?",
-                "Bf4",
-                "e3",
-                "How should I continue developing?",
-                "Nbd2",
-                "Bd3",
-                "What's my typical plan in the middlegame?",
-            ],
+    ),
+
+    # Scenario 8: London System - Beginner
+    ConversationScenario(
+        name="London System - Beginner",
+        skill_level="beginner",
+        description="Solid d4 system with fundamental questions",
+        user_inputs=(
+            "d4",
+            "Nf3",
+            "What makes the London System good for beginners?",
+            "Bf4",
+            "e3",
+            "How should I continue developing?",
+            "Nbd2",
+            "Bd3",
+            "What's my typical plan in the middlegame?",
         ),
-
-        # Scenario 9: Chat-Only - Intermediate
-        ConversationScenario(
-            name="Chess Concepts Discussion - Intermediate",
-            skill_level="intermediate",
-            description="Pure chat scenario without moves",
-            user_inputs=[
-                "Can you explain the concept of weak squares?",
-                "How do I know when to trade pieces?",
-                "What's the difference between tactics and strategy?",
-                "When should I start thinking about the endgame?",
-                "How important is piece activity compared to material?",
-                "Can you explain pawn chains and how to attack them?",
-            ],
+    ),
+
+    # Scenario 9: Chat-Only - Intermediate
+    ConversationScenario(
+        name="Chess Concepts Discussion - Intermediate",
+        skill_level="intermediate",
+        description="Pure chat scenario without moves",
+        user_inputs=(
+            "Can you explain the concept of weak squares?",
+            "How do I know when to trade pieces?",
+            "What's the difference between tactics and strategy?",
+            "When should I start thinking about the endgame?",
+            "How important is piece activity compared to material?",
+            "Can you explain pawn chains and how to attack them?",
         ),
-
-        # Scenario 10: Catalan-style - Advanced
-        ConversationScenario(
-            name="Catalan Setup - Advanced",
-            skill_level="advanced",
-            description="Sophisticated d4 + g3 system with deep analysis",
-            user_inputs=[
-                "d4",
-                "c4",
-                "How does the Catalan differ from the Queen's Gambit?",
-                "g3",
-                "Bg2",
-                "Analyze the long diagonal and central tension.",
-                "Nf3",
-                "O-O",
-                "What are the typical pawn breaks and piece maneuvers?",
-            ],
+    ),
+
+    # Scenario 10: Catalan-style - Advanced
+    ConversationScenario(
+        name="Catalan Setup - Advanced",
+        skill_level="advanced",
+        description="Sophisticated d4 + g3 system with deep analysis",
+        user_inputs=(
+            "d4",
+            "c4",
+            "How does the Catalan differ from the Queen's Gambit?",
+            "g3",
+            "Bg2",
+            "Analyze the long diagonal and central tension.",
+            "Nf3",
+            "O-O",
+            "What are the typical pawn breaks and piece maneuvers?",
         ),
-    ]
+    ),
+)
 
-    return scenarios
 
+def create_stockfish_pool() -> StockfishPool:
+    """
+    Build the warm engine pool shared by a process's scenarios.
 
-def run_scenario(scenario: ConversationScenario, verbose: bool = True) -> dict:
+    Engines are spawned lazily and reset between scenarios. Settings are
+    read here, once .env has been loaded, rather than at import.
+    """
+    settings = get_settings()
+    return StockfishPool(
+        path=settings.stockfish_path,
+        depth=settings.stockfish_depth,
+        multipv=settings.stockfish_multipv,
+        hash_mb=settings.stockfish_hash_mb,
+    )
+
+
+def create_scenarios() -> tuple[ConversationScenario, ...]:
+    """Return the predefined conversation scenarios."""
+    return SCENARIOS
+
+
+async def run_scenario(scenario: ConversationScenario, pool: StockfishPool) -> dict:
     """
     Run a single conversation scenario.
 
+    Turns are awaited one after another since each depends on the previous
+    board state; concurrency happens across scenarios (see run_scenarios).
+    Progress goes to the "chess_tutor.sim" logger at INFO level.
+
     Args:
         scenario: The scenario to run
-        verbose: If True, print progress information
+        pool: Engine pool to check a Stockfish instance out of
 
     Returns:
         Dictionary with statistics about the run
     """
-    if verbose:
-        print(f"\n{'=' * 70}")
-        print(f"Running: {scenario.name}")
-        print(f"Skill Level: {scenario.skill_level}")
-        print(f"Inputs: {len(scenario.user_inputs)} turns")
-        print(f"{'=' * 70}")
+    n = len(scenario.user_inputs)
+
+    log.info(
+        "\n%s\nRunning: %s\nSkill Level: %s\nInputs: %d turns\n%s",
+        _RULE, scenario.name, scenario.skill_level, n, _RULE,
+    )
 
     stats = {
         "scenario": scenario.name,
@@ -247,46 +278,45 @@ def run_scenario(scenario: ConversationScenario, verbose: bool = True) -> dict:
         "error": None,
     }
 
+    stockfish = None
     try:
+        # Check out a warm engine instead of spawning one per scenario
+        stockfish = await asyncio.to_thread(pool.acquire)
+
         # Initialize orchestrator with scenario's skill level
-        orchestrator = TutorOrchestrator(user_level=scenario.skill_level)
+        orchestrator = TutorOrchestrator(user_level=scenario.skill_level, stockfish=stockfish)
         stats["thread_id"] = orchestrator.thread_id
 
-        if verbose:
-            print(f"Thread ID: {orchestrator.thread_id}\n")
+        log.info("Thread ID: %s\n", orchestrator.thread_id)
 
         # Process each user input in the scenario
         for i, user_input in enumerate(scenario.user_inputs, 1):
             try:
-                # Track FEN before to detect move vs chat mode
-                fen_before = orchestrator.current_fen
-
                 # Process the turn
-                plan = orchestrator.process_turn(user_input)
+                plan = await orchestrator.aprocess_turn(user_input)
                 stats["total_turns"] += 1
 
-                # Detect if it was a move or chat turn
-                is_move = (orchestrator.current_fen != fen_before) or (plan.opponent_reply is not None)
-
-                if is_move:
+                # The orchestrator tags each plan with the mode it ran in
+                if plan.mode == "move":
                     stats["move_turns"] += 1
                     mode = "MOVE"
                 else:
                     stats["chat_turns"] += 1
                     mode = "CHAT"
 
-                if verbose:
-                    # Show brief summary
+                if log.isEnabledFor(logging.INFO):
+                    # Show brief summary (one record per turn)
                     input_preview = user_input[:40] + "..." if len(user_input) > 40 else user_input
-                    print(f"  [{i}/{len(scenario.user_inputs)}] [{mode}] {input_preview}")
-
-                    # Show tutor's move if applicable
                     if plan.opponent_reply:
-                        print(f"      → Tutor played: {plan.opponent_reply}")
+                        log.info(
+                            "  [%d/%d] [%s] %s\n      → Tutor played: %s",
+                            i, n, mode, input_preview, plan.opponent_reply,
+                        )
+                    else:
+                        log.info("  [%d/%d] [%s] %s", i, n, mode, input_preview)
 
             except Exception as e:
-                if verbose:
-                    print(f"  ⚠️  Error on turn {i}: {e}")
+                log.warning("  ⚠️  Error on turn %d: %s", i, e)
                 stats["error"] = f"Turn {i}: {str(e)}"
                 break
 
@@ -294,23 +324,126 @@ def run_scenario(scenario: ConversationScenario, verbose: bool = True) -> dict:
         orchestrator.close()
 
         # Mark as successful if we completed all turns
-        if stats["total_turns"] == len(scenario.user_inputs):
+        if stats["total_turns"] == n:
             stats["success"] = True
 
-        if verbose:
-            print(f"\n✓ Completed: {stats['total_turns']} turns ({stats['move_turns']} moves, {stats['chat_turns']} chat)")
-            if not stats["success"]:
-                print(f"  ⚠️  {stats['error']}")
+        log.info(
+            "\n✓ Completed: %d turns (%d moves, %d chat)",
+            stats["total_turns"], stats["move_turns"], stats["chat_turns"],
+        )
 
     except Exception as e:
         stats["error"] = f"Initialization error: {str(e)}"
-        if verbose:
-            print(f"\n⚠️  Failed to initialize: {e}")
+        log.warning("\n⚠️  Failed to initialize: %s", e)
+    finally:
+        # Reset the engine for the next scenario instead of quitting it
+        if stockfish is not None:
+            pool.release(stockfish)
 
     return stats
 
 
-def list_scenarios(scenarios: list[ConversationScenario]) -> None:
+async def run_scenarios(
+    scenarios: list[ConversationScenario],
+    concurrency: int,
+    pool: StockfishPool,
+) -> list[dict]:
+    """
+    Run scenarios concurrently so the inference backend can batch them.
+
+    Args:
+        scenarios: Scenarios to run (repeats already expanded)
+        concurrency: Maximum number of scenarios in flight at once
+        pool: Engine pool shared by the scenarios
+
+    Returns:
+        List of per-scenario statistics, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total_runs = len(scenarios)
+
+    async def run_one(run_num: int, scenario: ConversationScenario) -> dict:
+        async with semaphore:
+            log.info("\n[Run %d/%d]", run_num, total_runs)
+            return await run_scenario(scenario, pool)
+
+    return await asyncio.gather(
+        *(run_one(i, scenario) for i, scenario in enumerate(scenarios, 1))
+    )
+
+
+def configure_logging(quiet: bool) -> None:
+    """Send simulator progress to stdout; --quiet keeps only warnings."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers[:] = [handler]
+    log.propagate = False
+    log.setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+def _init_worker(quiet: bool) -> None:
+    """Per-process setup for ProcessPoolExecutor workers."""
+    load_dotenv()
+    configure_logging(quiet)
+
+
+def _run_batch(indices: list[int], concurrency: int) -> list[dict]:
+    """Run a batch of scenarios (by index into SCENARIOS) inside a worker process."""
+    scenarios = [SCENARIOS[i] for i in indices]
+    pool = create_stockfish_pool()
+    try:
+        return asyncio.run(run_scenarios(scenarios, concurrency, pool))
+    finally:
+        pool.close()
+
+
+def run_in_processes(
+    indices: list[int],
+    workers: int,
+    concurrency: int,
+) -> list[dict]:
+    """
+    Spread scenarios across worker processes.
+
+    Each worker runs its share concurrently (see run_scenarios), so
+    Python-side orchestration, parsing, and JSON work use multiple cores.
+    Workers receive indices into SCENARIOS rather than pickled scenarios,
+    and inherit this process's log level.
+
+    Args:
+        indices: Indices of scenarios to run (repeats already expanded)
+        workers: Number of worker processes
+        concurrency: Maximum scenarios in flight per worker
+
+    Returns:
+        List of per-scenario statistics, in completion order
+    """
+    # Contiguous slices keep same-prefix scenarios on the same worker
+    batch_size = -(-len(indices) // workers)
+    batches = [indices[i:i + batch_size] for i in range(0, len(indices), batch_size)]
+    all_stats = []
+    quiet = not log.isEnabledFor(logging.INFO)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(quiet,)
+    ) as executor:
+        futures = [
+            executor.submit(_run_batch, batch, concurrency)
+            for batch in batches
+            if batch
+        ]
+        for future in as_completed(futures):
+            all_stats.extend(future.result())
+
+    return all_stats
+
+
+def write_stats(stats: list[dict], path: Path) -> None:
+    """Write per-scenario statistics (incl. thread IDs) as JSON Lines in one buffer."""
+    path.write_bytes(b"".join(orjson.dumps(s) + b"\n" for s in stats))
+
+
+def list_scenarios(scenarios: tuple[ConversationScenario, ...]) -> None:
     """List all available scenarios."""
     print("\n" + "=" * 70)
     print("AVAILABLE SCENARIOS")
@@ -338,6 +471,9 @@ Examples:
   %(prog)s --count 5          # Run 5 random scenarios
   %(prog)s --scenario 0 2 4   # Run specific scenarios by index
   %(prog)s --repeat 3         # Run all scenarios 3 times each
+  %(prog)s --concurrency 10   # Run up to 10 scenarios at once
+  %(prog)s --workers 4        # Spread scenarios over 4 processes
+  %(prog)s --output runs.jsonl  # Also write per-run stats as JSON Lines
   %(prog)s --list             # List all available scenarios
         """
     )
@@ -353,6 +489,7 @@ Examples:
         "--scenario",
         type=int,
         nargs="+",
+        choices=range(len(SCENARIOS)),
         metavar="INDEX",
         help="Run specific scenario(s) by index (see --list)",
     )
@@ -365,6 +502,29 @@ Examples:
         help="Repeat each scenario N times (default: 1)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Maximum number of scenarios to run concurrently (default: 4)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes (default: 1, run in this process)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="Write per-run statistics (incl. thread IDs) to PATH as JSON Lines",
+    )
+
     parser.add_argument(
         "--list",
         action="store_true",
@@ -381,22 +541,25 @@ Examples:
 
     # Load environment variables
     load_dotenv()
-
-    # Create scenarios
-    scenarios = create_scenarios()
+    configure_logging(args.quiet)
 
     # Handle --list
     if args.list:
-        list_scenarios(scenarios)
+        list_scenarios(create_scenarios())
         return
 
     # Validate API configuration
+    settings = get_settings()
     if not settings.validate_api_key():
         print("\n⚠️  ERROR: OpenAI API key not configured!")
         print("Please set OPENAI_API_KEY in your .env file or environment.")
         print("Copy .env.example to .env and add your key.")
         sys.exit(1)
 
+    # Create scenarios (only once we know they will run)
+    scenarios = create_scenarios()
+    num_scenarios = len(scenarios)
+
     # Show configuration
     if not args.quiet:
         print("\n" + "=" * 70)
@@ -408,49 +571,45 @@ Examples:
         else:
             print("🔗 Using OpenAI API directly")
 
-        print(f"📊 Total scenarios available: {len(scenarios)}")
-
-    # Determine which scenarios to run
-    scenarios_to_run = []
+        print(f"📊 Total scenarios available: {num_scenarios}")
 
+    # Determine which scenarios to run (as indices into scenarios)
     if args.scenario is not None:
-        # Run specific scenarios
-        for idx in args.scenario:
-            if 0 <= idx < len(scenarios):
-                scenarios_to_run.append(scenarios[idx])
-            else:
-                print(f"⚠️  Warning: Scenario index {idx} out of range (0-{len(scenarios)-1}), skipping")
+        # Run specific scenarios (argparse has already range-checked them)
+        indices = args.scenario
     elif args.count is not None:
         # Run N random scenarios
-        count = min(args.count, len(scenarios))
-        scenarios_to_run = random.sample(scenarios, count)
+        count = min(args.count, num_scenarios)
+        indices = random.sample(range(num_scenarios), count)
     else:
         # Run all scenarios
-        scenarios_to_run = scenarios
+        indices = list(range(num_scenarios))
 
     if not args.quiet:
-        print(f"🎯 Running {len(scenarios_to_run)} scenario(s), {args.repeat} time(s) each")
+        print(f"🎯 Running {len(indices)} scenario(s), {args.repeat} time(s) each")
+        print(f"⚡ Concurrency: {args.concurrency} per process, {args.workers} process(es)")
         print("=" * 70)
 
-    # Run scenarios
-    all_stats = []
-    total_runs = len(scenarios_to_run) * args.repeat
-    current_run = 0
-
-    for repeat_num in range(args.repeat):
-        if args.repeat > 1 and not args.quiet:
-            print(f"\n{'#' * 70}")
-            print(f"# REPEAT {repeat_num + 1} / {args.repeat}")
-            print(f"{'#' * 70}")
-
-        for scenario in scenarios_to_run:
-            current_run += 1
-
-            if not args.quiet:
-                print(f"\n[Run {current_run}/{total_runs}]")
-
-            stats = run_scenario(scenario, verbose=not args.quiet)
-            all_stats.append(stats)
+    # Run scenarios concurrently (turns within a scenario stay sequential).
+    # Group by skill level so requests sharing a prompt prefix reach the
+    # backend back to back, improving prefix-cache hit rates.
+    runs = [idx for _ in range(args.repeat) for idx in indices]
+    runs.sort(key=lambda idx: scenarios[idx].skill_level)
+    if args.workers > 1:
+        # Each worker builds its own engine pool (see _run_batch)
+        all_stats = run_in_processes(runs, args.workers, args.concurrency)
+    else:
+        pool = create_stockfish_pool()
+        try:
+            all_stats = asyncio.run(
+                run_scenarios([scenarios[idx] for idx in runs], args.concurrency, pool)
+            )
+        finally:
+            pool.close()
+
+    # Workers hand their stats back through futures; only this process writes
+    if args.output is not None:
+        write_stats(all_stats, args.output)
 
     # Print summary
     print("\n" + "=" * 70)
@@ -458,12 +617,13 @@ Examples:
     print("=" * 70)
 
     successful = sum(1 for s in all_stats if s["success"])
-    failed = len(all_stats) - successful
+    total_conversations = len(all_stats)
+    failed = total_conversations - successful
     total_turns = sum(s["total_turns"] for s in all_stats)
     total_moves = sum(s["move_turns"] for s in all_stats)
     total_chats = sum(s["chat_turns"] for s in all_stats)
 
-    print(f"Total Conversations: {len(all_stats)}")
+    print(f"Total Conversations: {total_conversations}")
     print(f"  ✓ Successful: {successful}")
     print(f"  ✗ Failed: {failed}")
     print(f"\nTotal Turns: {total_turns}")
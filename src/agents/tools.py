@@ -1,18 +1,74 @@
 """Tool definitions and executor for chess tutor."""
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
+from threading import Lock
 from typing import Any, Callable, Optional
 
-from ..services.chess_state import ChessStateService
-from ..services.stockfish_service import StockfishService
+from ..services.chess_state import ChessStateService, GameStatus, MoveResult, position_key
+from ..services.stockfish_service import (
+    LineAnalysis,
+    MoveEvaluation,
+    PositionAnalysis,
+    StockfishService,
+)
+from ..utils.cache import LRUCache
+
+
+# Serialized analyze_position / evaluate_move results keyed by position
+# (Zobrist hash + halfmove clock, see position_key) and search settings.
+# Shared by every executor in the process: engine output at a fixed depth
+# does not depend on which engine instance produced it.
+ANALYSIS_CACHE_SIZE = 4096
+EVALUATION_CACHE_SIZE = 4096
+_analysis_cache: LRUCache[dict[str, Any]] = LRUCache(maxsize=ANALYSIS_CACHE_SIZE)
+_evaluation_cache: LRUCache[dict[str, Any]] = LRUCache(maxsize=EVALUATION_CACHE_SIZE)
+
+
+# ============================================================================
+# Result Converters
+# ============================================================================
+
+def _fields_converter(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a shallow dataclass-to-dict converter for cls.
+
+    Field names are resolved once; unlike asdict() there is no recursive
+    walk or deepcopy of leaf values, which tool results do not need since
+    the source objects are discarded after serialization.
+    """
+    names = tuple(f.name for f in fields(cls))
+    return lambda obj: {name: getattr(obj, name) for name in names}
+
+
+_line_to_dict = _fields_converter(LineAnalysis)
+_position_fields = _fields_converter(PositionAnalysis)
+
+
+def _position_to_dict(analysis: PositionAnalysis) -> dict[str, Any]:
+    """Convert a PositionAnalysis, including its nested lines."""
+    result = _position_fields(analysis)
+    result["lines"] = [_line_to_dict(line) for line in analysis.lines]
+    return result
+
+
+# Converters for every dataclass a tool handler returns
+_CONVERTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    MoveResult: MoveResult._asdict,
+    GameStatus: _fields_converter(GameStatus),
+    MoveEvaluation: _fields_converter(MoveEvaluation),
+    PositionAnalysis: _position_to_dict,
+}
 
 
 # ============================================================================
 # Tool Definitions (OpenAI Function Calling Format)
 # ============================================================================
 
+# Tuples: these are read-only request payloads shared by every session and
+# passed to the SDK as-is on each call, so nothing may append to them.
+
 # Full tools for move mode (includes apply_move for tutor's response)
-TOOL_DEFINITIONS = [
+TOOL_DEFINITIONS = (
     {
         "type": "function",
         "function": {
@@ -144,12 +200,12 @@ TOOL_DEFINITIONS = [
             }
         }
     }
-]
+)
 
 
 # Chat-only tools (no apply_move - we don't change the board in chat mode)
 # Only includes analysis tools for discussing positions
-CHAT_TOOL_DEFINITIONS = [
+CHAT_TOOL_DEFINITIONS = (
     {
         "type": "function",
         "function": {
@@ -215,7 +271,7 @@ CHAT_TOOL_DEFINITIONS = [
             }
         }
     }
-]
+)
 
 
 # ============================================================================
@@ -225,11 +281,23 @@ CHAT_TOOL_DEFINITIONS = [
 class ToolExecutor:
     """Executes tools and manages chess services."""
 
+    __slots__ = (
+        "chess_service",
+        "stockfish_service",
+        "_owns_stockfish",
+        "_handlers",
+        "_played_move",
+        "_played_lock",
+    )
+
     def __init__(
         self,
         stockfish_path: Optional[str] = None,
         stockfish_depth: int = 15,
         stockfish_multipv: int = 3,
+        stockfish_hash_mb: Optional[int] = None,
+        stockfish_cpu_core: Optional[int] = None,
+        stockfish_service: Optional[StockfishService] = None,
     ):
         """
         Initialize tool executor with chess services.
@@ -238,12 +306,19 @@ class ToolExecutor:
             stockfish_path: Path to Stockfish binary (auto-detect if None)
             stockfish_depth: Default analysis depth
             stockfish_multipv: Default number of lines to analyze
+            stockfish_hash_mb: Engine transposition table size in MB
+            stockfish_cpu_core: CPU to pin a newly spawned engine to
+            stockfish_service: Existing engine to use (e.g. from a StockfishPool).
+                The caller keeps ownership; close() will not shut it down.
         """
         self.chess_service = ChessStateService()
-        self.stockfish_service = StockfishService(
+        self._owns_stockfish = stockfish_service is None
+        self.stockfish_service = stockfish_service or StockfishService(
             path=stockfish_path,
             depth=stockfish_depth,
             multipv=stockfish_multipv,
+            hash_mb=stockfish_hash_mb,
+            cpu_core=stockfish_cpu_core,
         )
 
         # Map tool names to handlers
@@ -256,6 +331,10 @@ class ToolExecutor:
             "parse_pgn": self._parse_pgn,
         }
 
+        # (prev_fen, uci, new_fen) of the user's move this turn, see set_played_move
+        self._played_move: Optional[tuple[str, str, str]] = None
+        self._played_lock = Lock()
+
     def execute(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """
         Execute a tool by name.
@@ -267,18 +346,46 @@ class ToolExecutor:
         Returns:
             Tool result as dictionary
         """
-        if tool_name not in self._handlers:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             return {"error": f"Unknown tool: {tool_name}"}
 
         try:
-            result = self._handlers[tool_name](**arguments)
+            result = handler(**arguments)
         except Exception as e:
             result = {"error": str(e)}
 
         return result
 
+    def prefetch_analysis(self, fen: str) -> None:
+        """
+        Analyze a position ahead of time with default settings.
+
+        The result lands in the analysis cache, so a later analyze_position
+        call for the same FEN returns without re-running Stockfish.
+        """
+        self._analyze_position(fen)
+
+    def set_played_move(
+        self,
+        prev_fen: Optional[str] = None,
+        move: Optional[str] = None,
+        new_fen: Optional[str] = None,
+    ) -> None:
+        """
+        Record the user's move for the current turn (call with no args to clear).
+
+        A move turn's analyze_position(new_fen) and evaluate_move(prev_fen,
+        move) calls are then served by one combined engine run
+        (StockfishService.analyze_with_played_move), whichever comes first.
+        """
+        self._played_move = (prev_fen, move, new_fen) if prev_fen and move and new_fen else None
+
     def _serialize_result(self, obj: Any) -> Any:
         """Serialize dataclass or other objects to dict."""
+        converter = _CONVERTERS.get(type(obj))
+        if converter is not None:
+            return converter(obj)
         if is_dataclass(obj) and not isinstance(obj, type):
             return asdict(obj)
         elif hasattr(obj, "__dict__"):
@@ -305,9 +412,23 @@ class ToolExecutor:
         depth: Optional[int] = None,
         multipv: Optional[int] = None,
     ) -> dict[str, Any]:
-        """Analyze position with Stockfish."""
-        result = self.stockfish_service.analyze(fen, depth, multipv)
-        return self._serialize_result(result)
+        """Analyze position with Stockfish (cached per position/depth/multipv)."""
+        depth = depth or self.stockfish_service.default_depth
+        multipv = multipv or self.stockfish_service.default_multipv
+        key = (*position_key(fen), depth, multipv)
+
+        cached = _analysis_cache.get(key)
+        if cached is None and self._played_move and self._played_move[2] == fen:
+            cached = self._analyze_played_move(depth, multipv)[1]
+        if cached is not None:
+            # The entry may come from another move number; report this FEN
+            return cached if cached["fen"] == fen else {**cached, "fen": fen}
+
+        result = self._serialize_result(
+            self.stockfish_service.analyze(fen, depth, multipv)
+        )
+        _analysis_cache.put(key, result)
+        return result
 
     def _evaluate_move(
         self,
@@ -315,9 +436,52 @@ class ToolExecutor:
         move: str,
         depth: Optional[int] = None,
     ) -> dict[str, Any]:
-        """Evaluate a specific move."""
-        result = self.stockfish_service.evaluate_move(prev_fen, move, depth)
-        return self._serialize_result(result)
+        """Evaluate a specific move (cached per position/move/depth)."""
+        depth = depth or self.stockfish_service.default_depth
+        key = (*position_key(prev_fen), move, depth)
+
+        cached = _evaluation_cache.get(key)
+        if cached is None and self._played_move and self._played_move[:2] == (prev_fen, move):
+            cached = self._analyze_played_move(depth)[0]
+        if cached is not None:
+            return cached
+
+        result = self._serialize_result(
+            self.stockfish_service.evaluate_move(prev_fen, move, depth)
+        )
+        _evaluation_cache.put(key, result)
+        return result
+
+    def _analyze_played_move(
+        self,
+        depth: int,
+        multipv: Optional[int] = None,
+    ) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        """
+        Fill both caches for this turn's move with one combined engine run.
+
+        Returns the (evaluation, analysis) entries; parallel tool calls for
+        the same turn wait on each other here instead of searching twice.
+        """
+        prev_fen, move, new_fen = self._played_move
+        multipv = multipv or self.stockfish_service.default_multipv
+        eval_key = (*position_key(prev_fen), move, depth)
+        analysis_key = (*position_key(new_fen), depth, multipv)
+
+        with self._played_lock:
+            evaluation = _evaluation_cache.get(eval_key)
+            analysis = _analysis_cache.get(analysis_key)
+            if evaluation is None or analysis is None:
+                move_eval, position = self.stockfish_service.analyze_with_played_move(
+                    prev_fen, move, depth, multipv
+                )
+                evaluation = self._serialize_result(move_eval)
+                _evaluation_cache.put(eval_key, evaluation)
+                if position is not None:
+                    analysis = self._serialize_result(position)
+                    _analysis_cache.put(analysis_key, analysis)
+
+        return evaluation, analysis
 
     def _parse_pgn(self, pgn: str) -> dict[str, Any]:
         """Parse PGN to final FEN."""
@@ -325,4 +489,5 @@ class ToolExecutor:
 
     def close(self):
         """Clean up resources."""
-        self.stockfish_service.close()
+        if self._owns_stockfish:
+            self.stockfish_service.close()
@@ -1,26 +1,157 @@
 """Main tutor orchestrator with agentic loop."""
 
+import asyncio
+import hashlib
 import json
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 
-from openai import OpenAI
+import chess
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
 from .tools import ToolExecutor, TOOL_DEFINITIONS, CHAT_TOOL_DEFINITIONS
-from ..services.chess_state import ChessStateService
-from ..utils.config import settings
+from ..services.chess_state import ChessStateService, MoveResult
+from ..services.stockfish_service import StockfishService
+from ..utils.cache import LRUCache
+from ..utils.config import get_settings
 from ..utils.prompts import SYSTEM_PROMPT, make_turn_prompt, make_chat_prompt
-from ..utils.schemas import TutorPlan, MoveClassification
+from ..utils.schemas import GOOD, TutorPlan
 
 
-@dataclass
+# Grounding citations are display hints; longer ones are cut once, here
+MAX_CITATION_LEN = 80
+
+# Cheap shape check for inputs that could parse as a move: castling, or
+# python-chess's own SAN pattern (which also matches UCI and long algebraic).
+# Anything else is chat and never needs a board.
+_MOVE_RE = re.compile(r"[O0]-[O0](?:-[O0])?[+#]?\Z|" + chess.SAN_REGEX.pattern)
+
+# Shared, never mutated: the first message of every request
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Decodes the TutorPlan object in place, wherever it sits in the response
+_JSON_DECODER = json.JSONDecoder()
+
+# Rough token estimate for history trimming (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(message: dict[str, Any]) -> int:
+    """Approximate token count of a chat message."""
+    return len(message.get("content") or "") // CHARS_PER_TOKEN + 4
+
+
+# Connection settings for the shared LLM HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
+
+@lru_cache
+def _shared_http_client() -> httpx.Client:
+    """
+    Process-wide HTTP/2 client shared by every orchestrator's OpenAI client.
+
+    Keep-alive connections are reused across agentic-loop iterations and
+    sessions instead of each client doing its own TCP/TLS handshakes.
+    """
+    return DefaultHttpxClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache
+def _shared_async_http_client() -> httpx.AsyncClient:
+    """
+    Async counterpart of _shared_http_client.
+
+    Pooled connections belong to the event loop that opened them, so all
+    async turns in a process should run on one loop (as the demo and the
+    simulator do).
+    """
+    return DefaultAsyncHttpxClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@dataclass(slots=True)
 class ParsedInput:
     """Result of parsing user input."""
     is_move: bool
     move_uci: Optional[str] = None
     move_san: Optional[str] = None
     raw_input: str = ""
+    apply_result: Optional[MoveResult] = None  # Reused when the move is played
+
+
+@dataclass(slots=True)
+class PlanDelta:
+    """A chunk of a streamed tutor turn."""
+    text: str = ""  # Newly decoded explanation text
+    mode: Optional[str] = None  # "move" or "chat" (first delta only)
+    plan: Optional[TutorPlan] = None  # Final plan (last delta only)
+
+
+class _ExplainStreamer:
+    """Incrementally extracts the "explain" string from streamed TutorPlan JSON."""
+
+    _START = re.compile(r'"explain"\s*:\s*"')
+    _ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos: Optional[int] = None  # Index just past the opening quote
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add streamed content; return any newly completed explanation text."""
+        if self._done:
+            return ""
+
+        self._buffer += chunk
+        if self._pos is None:
+            match = self._START.search(self._buffer)
+            if match is None:
+                return ""
+            self._pos = match.end()
+
+        buf = self._buffer
+        i = self._pos
+        out = []
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._done = True
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+
+            # Escape sequence - wait until it has fully arrived
+            if i + 1 >= len(buf):
+                break
+            esc = buf[i + 1]
+            if esc != "u":
+                out.append(self._ESCAPES.get(esc, esc))
+                i += 2
+                continue
+            if i + 6 > len(buf):
+                break
+            width = 6
+            try:
+                if 0xD800 <= int(buf[i + 2:i + 6], 16) <= 0xDBFF:
+                    width = 12  # High surrogate - needs its low half too
+                if i + width > len(buf):
+                    break
+                out.append(json.loads(f'"{buf[i:i + width]}"'))
+            except ValueError:
+                pass  # Malformed escape - skip it
+            i += width
+
+        self._pos = i
+        return "".join(out)
 
 
 class TutorOrchestrator:
@@ -34,9 +165,16 @@ class TutorOrchestrator:
     4. For chat: tutor responds conversationally (no board changes)
 
     When using vLLora gateway, sends x-run-id and x-thread-id headers for tracing.
+
+    Turns can be processed synchronously with ``process_turn`` or awaited with
+    ``aprocess_turn``; the async variant lets many sessions share one event loop
+    so the inference backend can batch their requests.
     """
 
     MAX_TOOL_ITERATIONS = 10  # Safety limit for tool loop
+    TOOL_WORKERS = 4  # Threads for running one turn's tool calls in parallel
+    MIN_HISTORY_TURNS = 2  # Most recent turns kept regardless of token budget
+    RESPONSE_CACHE_SIZE = 64  # Final LLM responses remembered per session
 
     def __init__(
         self,
@@ -45,6 +183,8 @@ class TutorOrchestrator:
         user_level: str = "intermediate",
         stockfish_path: Optional[str] = None,
         thread_id: Optional[str] = None,
+        stockfish: Optional[StockfishService] = None,
+        cache_responses: bool = False,
     ):
         """
         Initialize the tutor orchestrator.
@@ -55,11 +195,23 @@ class TutorOrchestrator:
             user_level: Student's skill level
             stockfish_path: Path to Stockfish binary
             thread_id: Optional thread ID for vLLora tracing (auto-generated if None)
+            stockfish: Existing engine to reuse (e.g. checked out of a StockfishPool);
+                a new one is spawned if None
+            cache_responses: Replay the final reply when the same prompt is sent
+                again at the same position. Off by default: a replayed turn makes
+                no LLM request, so it produces no trace
         """
+        settings = get_settings()
         self.api_key = api_key or settings.openai_api_key
         self.model = model or settings.openai_model
         self.user_level = user_level
 
+        # Sampling settings are read once here rather than on every LLM call
+        self.temperature = settings.openai_temperature
+        self.max_tokens = settings.openai_max_tokens
+        self.max_history_tokens = settings.max_history_tokens
+        self.json_mode = settings.openai_json_mode
+
         # Thread ID for vLLora tracing (persists across turns)
         self.thread_id = thread_id or str(uuid.uuid4())
 
@@ -69,7 +221,10 @@ class TutorOrchestrator:
         if base_url:
             client_kwargs["base_url"] = base_url
 
-        self.client = OpenAI(**client_kwargs)
+        self.client = OpenAI(**client_kwargs, http_client=_shared_http_client())
+        self.async_client = AsyncOpenAI(
+            **client_kwargs, http_client=_shared_async_http_client()
+        )
 
         # Initialize services
         self.chess_service = ChessStateService()
@@ -77,6 +232,18 @@ class TutorOrchestrator:
             stockfish_path=stockfish_path or settings.stockfish_path,
             stockfish_depth=settings.stockfish_depth,
             stockfish_multipv=settings.stockfish_multipv,
+            stockfish_hash_mb=settings.stockfish_hash_mb,
+            stockfish_cpu_core=settings.stockfish_cpu_core,
+            stockfish_service=stockfish,
+        )
+        # Threads are started lazily, only once a turn issues several tool calls
+        self._tool_pool = ThreadPoolExecutor(
+            max_workers=self.TOOL_WORKERS, thread_name_prefix="tutor-tool"
+        )
+
+        # Final responses keyed by the turn prompt (see _response_key)
+        self._response_cache: Optional[LRUCache[str]] = (
+            LRUCache(maxsize=self.RESPONSE_CACHE_SIZE) if cache_responses else None
         )
 
         # Game state
@@ -91,8 +258,11 @@ class TutorOrchestrator:
         self.game_history = []
         self.conversation_history = []
         self.is_new_game = True
-        # Generate new thread ID for new game
+        # Generate new thread ID for new game; cached replies belong to the
+        # old thread, and a new game's first prompt would otherwise match them
         self.thread_id = str(uuid.uuid4())
+        if self._response_cache is not None:
+            self._response_cache.clear()
 
     def _generate_run_id(self) -> str:
         """Generate a unique run ID for each LLM call."""
@@ -120,6 +290,10 @@ class TutorOrchestrator:
         """
         clean_input = user_input.strip()
 
+        # Most chat messages can't be moves; skip board work for them
+        if _MOVE_RE.match(clean_input) is None:
+            return ParsedInput(is_move=False, raw_input=clean_input)
+
         # Try to apply as a move (this handles both UCI and SAN)
         result = self.chess_service.apply_move(self.current_fen, clean_input)
 
@@ -129,6 +303,7 @@ class TutorOrchestrator:
                 move_uci=result.uci,
                 move_san=result.san,
                 raw_input=clean_input,
+                apply_result=result,
             )
 
         # Not a valid move - it's chat
@@ -158,6 +333,74 @@ class TutorOrchestrator:
         else:
             return self._process_chat_turn(parsed, run_id)
 
+    async def aprocess_turn(self, user_input: str) -> TutorPlan:
+        """
+        Async variant of process_turn using the AsyncOpenAI client.
+
+        Turns within one session still run sequentially, but separate
+        orchestrators can await their turns concurrently.
+
+        Args:
+            user_input: User's input (move or message)
+
+        Returns:
+            TutorPlan with tutor's response
+        """
+        run_id = self._generate_run_id()
+        parsed = self._parse_user_input(user_input)
+
+        if parsed.is_move:
+            self._start_move_turn(parsed)
+            tutor_plan = await self._arun_agentic_loop(run_id, is_move_mode=True)
+            return self._complete_move_turn(tutor_plan)
+        else:
+            self._start_chat_turn(parsed)
+            tutor_plan = await self._arun_agentic_loop(run_id, is_move_mode=False)
+            return self._complete_chat_turn(tutor_plan)
+
+    async def process_turn_stream(self, user_input: str) -> AsyncIterator[PlanDelta]:
+        """
+        Process a turn, streaming the tutor's explanation as it is generated.
+
+        The first delta carries the turn mode, following deltas carry
+        explanation text, and the last delta carries the final TutorPlan.
+        In move mode, Stockfish starts analyzing the new position in a
+        worker thread while the LLM decodes, so the analyze_position call
+        the tutor makes is usually served from that warm result.
+
+        Args:
+            user_input: User's input (move or message)
+
+        Yields:
+            PlanDelta chunks
+        """
+        run_id = self._generate_run_id()
+        parsed = self._parse_user_input(user_input)
+
+        prefetch = None
+        if parsed.is_move:
+            self._start_move_turn(parsed)
+            prefetch = asyncio.create_task(
+                asyncio.to_thread(self.tool_executor.prefetch_analysis, self.current_fen)
+            )
+            yield PlanDelta(mode="move")
+        else:
+            self._start_chat_turn(parsed)
+            yield PlanDelta(mode="chat")
+
+        tutor_plan = None
+        async for delta in self._astream_agentic_loop(run_id, parsed.is_move, prefetch):
+            if delta.plan is None:
+                yield delta
+            else:
+                tutor_plan = delta.plan
+
+        if parsed.is_move:
+            tutor_plan = self._complete_move_turn(tutor_plan)
+        else:
+            tutor_plan = self._complete_chat_turn(tutor_plan)
+        yield PlanDelta(plan=tutor_plan)
+
     def _process_move_turn(self, parsed: ParsedInput, run_id: str) -> TutorPlan:
         """
         Process a turn where user made a valid move.
@@ -166,10 +409,20 @@ class TutorOrchestrator:
         2. Analyze position
         3. Get tutor response with opponent move
         """
-        # Apply the user's move (we already validated it parses)
-        result = self.chess_service.apply_move(self.current_fen, parsed.raw_input)
+        self._start_move_turn(parsed)
+
+        # Run agentic loop with move tools
+        tutor_plan = self._run_agentic_loop(run_id, is_move_mode=True)
+
+        return self._complete_move_turn(tutor_plan)
+
+    def _start_move_turn(self, parsed: ParsedInput) -> None:
+        """Apply the user's move and queue the move-mode prompt."""
+        # Apply the user's move (already validated and applied while parsing)
+        result = parsed.apply_result
 
         if result.success and result.new_fen:
+            self.tool_executor.set_played_move(self.current_fen, result.uci, result.new_fen)
             self.current_fen = result.new_fen
             self.game_history.append({
                 "san": result.san,
@@ -193,11 +446,10 @@ class TutorOrchestrator:
             "role": "user",
             "content": turn_prompt,
         })
+        self._trim_history()
 
-        # Run agentic loop with move tools
-        tutor_plan = self._run_agentic_loop(run_id, is_move_mode=True)
-
-        # Apply tutor's response move if valid
+    def _complete_move_turn(self, tutor_plan: TutorPlan) -> TutorPlan:
+        """Apply the tutor's reply move (if valid) after the agentic loop."""
         if tutor_plan.opponent_reply:
             tutor_result = self.chess_service.apply_move(self.current_fen, tutor_plan.opponent_reply)
             if tutor_result.success and tutor_result.new_fen:
@@ -208,6 +460,7 @@ class TutorOrchestrator:
                     "role": "tutor",
                 })
 
+        tutor_plan.mode = "move"
         self.is_new_game = False
         return tutor_plan
 
@@ -217,6 +470,17 @@ class TutorOrchestrator:
 
         DO NOT change the board state. Just respond conversationally.
         """
+        self._start_chat_turn(parsed)
+
+        # Run agentic loop with chat tools only (no move tools)
+        tutor_plan = self._run_agentic_loop(run_id, is_move_mode=False)
+
+        return self._complete_chat_turn(tutor_plan)
+
+    def _start_chat_turn(self, parsed: ParsedInput) -> None:
+        """Queue the chat-mode prompt without touching the board."""
+        self.tool_executor.set_played_move()
+
         # Build chat prompt
         chat_prompt = make_chat_prompt(
             user_input=parsed.raw_input,
@@ -230,13 +494,14 @@ class TutorOrchestrator:
             "role": "user",
             "content": chat_prompt,
         })
+        self._trim_history()
 
-        # Run agentic loop with chat tools only (no move tools)
-        tutor_plan = self._run_agentic_loop(run_id, is_move_mode=False)
-
+    def _complete_chat_turn(self, tutor_plan: TutorPlan) -> TutorPlan:
+        """Finalize a chat turn after the agentic loop."""
         # IMPORTANT: In chat mode, ignore any opponent_reply the LLM might return
         tutor_plan.opponent_reply = None
 
+        tutor_plan.mode = "chat"
         self.is_new_game = False
         return tutor_plan
 
@@ -251,10 +516,7 @@ class TutorOrchestrator:
         Returns:
             Extracted TutorPlan from LLM response
         """
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            *self.conversation_history,
-        ]
+        messages = self._base_messages()
 
         # Use appropriate tools based on mode
         tools = TOOL_DEFINITIONS if is_move_mode else CHAT_TOOL_DEFINITIONS
@@ -262,110 +524,453 @@ class TutorOrchestrator:
         # Use the same run_id for all LLM calls within this turn
         extra_headers = self._get_extra_headers(run_id)
 
+        # An identical request was already answered in this session
+        cache_key = self._response_key(messages, is_move_mode)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return self._finish_agentic_loop(cached)
+
+        # Loop-invariant arguments; messages is the same list, grown in place
+        kwargs = self._completion_kwargs(messages, tools, extra_headers)
+
         for iteration in range(self.MAX_TOOL_ITERATIONS):
+            if iteration == self.MAX_TOOL_ITERATIONS - 1:
+                self._force_final_answer(kwargs)
+
             # Call LLM with vLLora headers
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=tools if tools else None,
-                tool_choice="auto" if tools else None,
-                temperature=settings.openai_temperature,
-                max_tokens=settings.openai_max_tokens,
-                extra_headers=extra_headers,
-            )
+            response = self.client.chat.completions.create(**kwargs)
 
             assistant_message = response.choices[0].message
 
             # Check if we have tool calls to process
             if assistant_message.tool_calls:
-                # Add assistant message to conversation
-                messages.append({
-                    "role": "assistant",
-                    "content": assistant_message.content,
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            }
-                        }
-                        for tc in assistant_message.tool_calls
-                    ],
-                })
+                self._execute_tool_calls(
+                    messages,
+                    assistant_message.content,
+                    self._tool_call_dicts(assistant_message.tool_calls),
+                )
+            else:
+                # No tool calls - LLM is done, extract TutorPlan
+                return self._finish_agentic_loop(assistant_message.content or "", cache_key)
 
-                # Execute each tool call
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    try:
-                        tool_args = json.loads(tool_call.function.arguments)
-                    except json.JSONDecodeError:
-                        tool_args = {}
-
-                    # Execute tool
-                    result = self.tool_executor.execute(
-                        tool_name=tool_name,
-                        arguments=tool_args,
-                    )
+        return self._max_iterations_plan()
+
+    async def _arun_agentic_loop(self, run_id: str, is_move_mode: bool = True) -> TutorPlan:
+        """
+        Async variant of _run_agentic_loop.
+
+        LLM calls are awaited on the AsyncOpenAI client; blocking tool work
+        (Stockfish, python-chess) runs in a worker thread so other sessions
+        on the event loop keep making progress.
+        """
+        messages = self._base_messages()
+
+        tools = TOOL_DEFINITIONS if is_move_mode else CHAT_TOOL_DEFINITIONS
+        extra_headers = self._get_extra_headers(run_id)
+
+        cache_key = self._response_key(messages, is_move_mode)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return self._finish_agentic_loop(cached)
+
+        kwargs = self._completion_kwargs(messages, tools, extra_headers)
+
+        for iteration in range(self.MAX_TOOL_ITERATIONS):
+            if iteration == self.MAX_TOOL_ITERATIONS - 1:
+                self._force_final_answer(kwargs)
 
-                    # In move mode, track tutor's move applications
-                    # (User moves are already applied before the loop)
-                    # We don't apply moves here - that's done after the loop
+            response = await self.async_client.chat.completions.create(**kwargs)
 
-                    # Add tool result to messages
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(result, indent=2),
-                    })
+            assistant_message = response.choices[0].message
 
+            if assistant_message.tool_calls:
+                await self._aexecute_tool_calls(
+                    messages,
+                    assistant_message.content,
+                    self._tool_call_dicts(assistant_message.tool_calls),
+                )
             else:
-                # No tool calls - LLM is done, extract TutorPlan
-                content = assistant_message.content or ""
+                return self._finish_agentic_loop(assistant_message.content or "", cache_key)
 
-                # Add final response to conversation history
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": content,
-                })
+        return self._max_iterations_plan()
+
+    async def _astream_agentic_loop(
+        self,
+        run_id: str,
+        is_move_mode: bool,
+        prefetch: Optional["asyncio.Task[None]"] = None,
+    ) -> AsyncIterator[PlanDelta]:
+        """
+        Streaming variant of _arun_agentic_loop.
+
+        Yields explanation text as soon as it is decoded and finishes with a
+        delta carrying the TutorPlan. Tool-call fragments are accumulated
+        per index until the stream for that iteration ends.
+
+        Args:
+            run_id: The run ID for this turn
+            is_move_mode: If True, use full tools. If False, use chat-only tools.
+            prefetch: Engine warm-up task to finish before tools touch Stockfish
+        """
+        messages = self._base_messages()
+
+        tools = TOOL_DEFINITIONS if is_move_mode else CHAT_TOOL_DEFINITIONS
+        extra_headers = self._get_extra_headers(run_id)
+        cache_key = self._response_key(messages, is_move_mode)
+
+        try:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                text = _ExplainStreamer().feed(cached)
+                if text:
+                    yield PlanDelta(text=text)
+                yield PlanDelta(plan=self._finish_agentic_loop(cached))
+                return
+
+            kwargs = self._completion_kwargs(messages, tools, extra_headers)
+            kwargs["stream"] = True
+
+            for iteration in range(self.MAX_TOOL_ITERATIONS):
+                if iteration == self.MAX_TOOL_ITERATIONS - 1:
+                    self._force_final_answer(kwargs)
+
+                stream = await self.async_client.chat.completions.create(**kwargs)
+
+                content_parts: list[str] = []
+                tool_calls: dict[int, dict[str, Any]] = {}
+                explain = _ExplainStreamer()
+
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+
+                    if delta.content:
+                        content_parts.append(delta.content)
+                        text = explain.feed(delta.content)
+                        if text:
+                            yield PlanDelta(text=text)
+
+                    for tc in delta.tool_calls or []:
+                        call = tool_calls.setdefault(tc.index, {
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        })
+                        if tc.id:
+                            call["id"] = tc.id
+                        if tc.function and tc.function.name:
+                            call["function"]["name"] += tc.function.name
+                        if tc.function and tc.function.arguments:
+                            call["function"]["arguments"] += tc.function.arguments
+
+                content = "".join(content_parts)
+
+                if tool_calls:
+                    # The engine is single-threaded: let the warm-up finish first
+                    if prefetch is not None:
+                        await prefetch
+                        prefetch = None
+                    await self._aexecute_tool_calls(
+                        messages,
+                        content or None,
+                        [tool_calls[i] for i in sorted(tool_calls)],
+                    )
+                else:
+                    yield PlanDelta(plan=self._finish_agentic_loop(content, cache_key))
+                    return
+
+            yield PlanDelta(plan=self._max_iterations_plan())
+        finally:
+            if prefetch is not None:
+                await prefetch
+
+    def _trim_history(self) -> None:
+        """
+        Drop the oldest turns once history exceeds max_history_tokens.
+
+        Every LLM call resends the whole history, so unbounded growth makes
+        long sessions quadratic in tokens. The latest MIN_HISTORY_TURNS
+        turns are always kept; each turn prompt already carries the FEN and
+        move list, so older turns are not needed to follow the game.
+        """
+        history = self.conversation_history
+        tokens = sum(_estimate_tokens(m) for m in history)
+        if tokens <= self.max_history_tokens:
+            return
+
+        # Each turn starts at a user message; only whole turns are dropped
+        starts = [i for i, m in enumerate(history) if m["role"] == "user"]
+        drop = 0
+        for start in starts[1:len(starts) - self.MIN_HISTORY_TURNS + 1]:
+            tokens -= sum(_estimate_tokens(m) for m in history[drop:start])
+            drop = start
+            if tokens <= self.max_history_tokens:
+                break
+
+        del history[:drop]
+
+    def _response_key(
+        self, messages: list[dict[str, Any]], is_move_mode: bool
+    ) -> Optional[bytes]:
+        """
+        Key a request by its thread, turn prompt and mode (None if caching is off).
+
+        The turn prompt carries the user input, FEN and move list, so the same
+        question asked again at the same position reuses the earlier final
+        response and skips the whole LLM round-trip. The thread ID keeps a new
+        game's opening prompt from replaying a reply traced under a previous game.
+        """
+        if self._response_cache is None:
+            return None
+        payload = orjson.dumps([self.thread_id, messages[-1]["content"], is_move_mode])
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _cached_response(self, cache_key: Optional[bytes]) -> Optional[str]:
+        """Return the remembered final response for cache_key, if any."""
+        if cache_key is None:
+            return None
+        return self._response_cache.get(cache_key)
+
+    def _base_messages(self) -> list[dict[str, Any]]:
+        """
+        Messages every LLM call in a turn starts from.
+
+        The static SYSTEM_PROMPT always comes first so every session shares a
+        byte-identical, prefix-cacheable request prefix. The list is a
+        per-turn copy: tool calls and results are appended to it, never to
+        conversation_history, so later turns don't resend tool traffic.
+        """
+        return [_SYSTEM_MESSAGE, *self.conversation_history]
+
+    def _completion_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: tuple[dict[str, Any], ...],
+        extra_headers: dict[str, str],
+    ) -> dict[str, Any]:
+        """Build chat.completions.create arguments shared by sync and async loops."""
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "extra_headers": extra_headers,
+        }
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+            # Independent lookups arrive in one message and run concurrently
+            kwargs["parallel_tool_calls"] = True
+        if self.json_mode:
+            # The final answer is always a TutorPlan object; JSON mode makes
+            # it parse on the fast path instead of the text fallback
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
+    @staticmethod
+    def _force_final_answer(kwargs: dict[str, Any]) -> None:
+        """
+        Forbid further tool calls for the last allowed iteration.
+
+        Otherwise a model that keeps calling tools burns the final round-trip
+        and the turn ends with the max-iterations fallback instead of an answer.
+        """
+        if "tools" in kwargs:
+            kwargs["tool_choice"] = "none"
+
+    def _execute_tool_calls(
+        self,
+        messages: list[dict[str, Any]],
+        content: Optional[str],
+        tool_calls: list[dict[str, Any]],
+    ) -> None:
+        """
+        Append the assistant's tool calls and their results to messages.
+
+        Args:
+            messages: Messages for the current agentic loop (mutated)
+            content: Assistant message content accompanying the calls
+            tool_calls: Tool calls in chat-completions message format
+        """
+        calls = self._start_tool_calls(messages, content, tool_calls)
+
+        # Execute tools; independent calls overlap (engine calls still take
+        # turns on the engine lock, but board tools run alongside them)
+        if len(calls) == 1:
+            results = [self.tool_executor.execute(*calls[0])]
+        else:
+            futures = [
+                self._tool_pool.submit(self.tool_executor.execute, name, args)
+                for name, args in calls
+            ]
+            results = [future.result() for future in futures]
+
+        self._add_tool_results(messages, tool_calls, results)
+
+    async def _aexecute_tool_calls(
+        self,
+        messages: list[dict[str, Any]],
+        content: Optional[str],
+        tool_calls: list[dict[str, Any]],
+    ) -> None:
+        """
+        Async variant of _execute_tool_calls.
+
+        Each call is awaited on the tool pool directly and gathered, so the
+        event loop is never blocked and no extra thread waits on the others.
+        """
+        calls = self._start_tool_calls(messages, content, tool_calls)
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._tool_pool, self.tool_executor.execute, name, args)
+            for name, args in calls
+        ))
+
+        self._add_tool_results(messages, tool_calls, results)
+
+    @staticmethod
+    def _start_tool_calls(
+        messages: list[dict[str, Any]],
+        content: Optional[str],
+        tool_calls: list[dict[str, Any]],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Append the assistant message and return (name, arguments) per tool call."""
+        # Add assistant message to conversation
+        messages.append({
+            "role": "assistant",
+            "content": content,
+            "tool_calls": tool_calls,
+        })
+
+        # Parse arguments up front so the calls can run independently
+        calls = []
+        for tool_call in tool_calls:
+            try:
+                tool_args = orjson.loads(tool_call["function"]["arguments"])
+            except orjson.JSONDecodeError:
+                tool_args = {}
+            calls.append((tool_call["function"]["name"], tool_args))
+        return calls
+
+    @staticmethod
+    def _add_tool_results(
+        messages: list[dict[str, Any]],
+        tool_calls: list[dict[str, Any]],
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Append tool results to messages, in tool_call order."""
+        # In move mode, track tutor's move applications
+        # (User moves are already applied before the loop)
+        # We don't apply moves here - that's done after the loop
+
+        # Add tool results to messages in one extend
+        # (compact JSON: indentation only costs the model tokens)
+        messages.extend(
+            {
+                "role": "tool",
+                "tool_call_id": tool_call["id"],
+                "content": orjson.dumps(result).decode(),
+            }
+            for tool_call, result in zip(tool_calls, results)
+        )
+
+    @staticmethod
+    def _tool_call_dicts(tool_calls: Any) -> list[dict[str, Any]]:
+        """Convert SDK tool call objects to chat-completions message format."""
+        return [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments,
+                }
+            }
+            for tc in tool_calls
+        ]
+
+    def _finish_agentic_loop(self, content: str, cache_key: Optional[bytes] = None) -> TutorPlan:
+        """
+        Record the final assistant response and extract the TutorPlan.
 
-                return self._extract_tutor_plan(content)
+        If cache_key is given the response is remembered for identical
+        requests later in the session (see _response_key).
+        """
+        # Add final response to conversation history
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": content,
+        })
 
+        if cache_key is not None:
+            self._response_cache.put(cache_key, content)
+
+        return self._extract_tutor_plan(content)
+
+    def _max_iterations_plan(self) -> TutorPlan:
+        """Fallback plan when the tool loop hits MAX_TOOL_ITERATIONS."""
         # Safety: max iterations reached
         return TutorPlan(
             explain="I apologize, but I encountered an issue processing this position. "
                     "Let me try again with a simpler approach.",
-            grounding_citations=["error: max tool iterations reached"],
-            move_evaluation=MoveClassification.GOOD,
+            grounding_citations=("error: max tool iterations reached",),
+            move_evaluation=GOOD,
         )
 
     def _extract_tutor_plan(self, content: str) -> TutorPlan:
         """
         Extract TutorPlan from LLM response.
 
-        Tries to find JSON in the response, falls back to creating
-        a basic plan from the text.
+        Uses the first JSON object in the response that validates as a
+        TutorPlan, falls back to creating a basic plan from the text.
         """
-        # Try to find JSON in response
-        json_start = content.find("{")
-        json_end = content.rfind("}") + 1
-
-        if json_start != -1 and json_end > json_start:
-            try:
-                json_str = content[json_start:json_end]
-                data = json.loads(json_str)
-                return TutorPlan(**data)
-            except (json.JSONDecodeError, ValueError):
-                pass
+        plan = self._parse_tutor_plan(content)
+        if plan is not None:
+            plan.grounding_citations = tuple(
+                c if len(c) <= MAX_CITATION_LEN else c[:MAX_CITATION_LEN] + "…"
+                for c in plan.grounding_citations
+            )
+            return plan
 
         # Fallback: create basic plan from text
         return TutorPlan(
             explain=content,
-            grounding_citations=["fallback: could not parse structured response"],
-            move_evaluation=MoveClassification.GOOD,
+            grounding_citations=("fallback: could not parse structured response",),
+            move_evaluation=GOOD,
         )
 
+    @staticmethod
+    def _parse_tutor_plan(content: str) -> Optional[TutorPlan]:
+        """
+        Find and validate the TutorPlan JSON object in an LLM response.
+
+        A response that is pure JSON is parsed and validated in one
+        pydantic-core pass, with no intermediate dict. Otherwise objects
+        are decoded in place from each "{" onwards, so stray braces in prose
+        or code fences, trailing text, and extra fragments are skipped
+        instead of spoiling a single find/rfind slice.
+        """
+        text = content.strip()
+        if text.startswith("{") and text.endswith("}"):
+            try:
+                return TutorPlan.model_validate_json(text)
+            except ValueError:  # ValidationError covers bad JSON and bad fields
+                pass
+
+        start = content.find("{")
+        while start != -1:
+            try:
+                data, _ = _JSON_DECODER.raw_decode(content, start)
+                if isinstance(data, dict):
+                    return TutorPlan(**data)
+            except ValueError:
+                pass
+            start = content.find("{", start + 1)
+
+        return None
+
     def get_board_display(self) -> str:
         """Get ASCII representation of current board."""
         return self.chess_service.board_ascii(self.current_fen)
@@ -374,7 +979,7 @@ class TutorOrchestrator:
         """Get current game status."""
         status = self.chess_service.game_status(self.current_fen)
         return {
-            "status": status.status.value,
+            "status": status.status,
             "turn": status.turn,
             "is_game_over": status.is_game_over,
             "winner": status.winner,
@@ -383,4 +988,5 @@ class TutorOrchestrator:
 
     def close(self) -> None:
         """Clean up resources."""
+        self._tool_pool.shutdown(wait=True)
         self.tool_executor.close()
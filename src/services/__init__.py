@@ -1,6 +1,6 @@
 """Chess services."""
 
 from .chess_state import ChessStateService
-from .stockfish_service import StockfishService
+from .stockfish_service import StockfishPool, StockfishService
 
-__all__ = ["ChessStateService", "StockfishService"]
+__all__ = ["ChessStateService", "StockfishPool", "StockfishService"]
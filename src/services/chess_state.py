@@ -1,28 +1,79 @@
 """Chess state service using python-chess library."""
 
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
 import chess
 import chess.pgn
+import chess.polyglot
 import io
 
+from ..utils.cache import LRUCache
+from ..utils.schemas import (
+    CHECK,
+    CHECKMATE,
+    FIFTY_MOVE_RULE,
+    INSUFFICIENT_MATERIAL,
+    ONGOING,
+    STALEMATE,
+    THREEFOLD_REPETITION,
+    GameStatusType,
+)
 
-class GameStatusType(str, Enum):
-    """Game status types."""
-    ONGOING = "ongoing"
-    CHECK = "check"
-    CHECKMATE = "checkmate"
-    STALEMATE = "stalemate"
-    INSUFFICIENT_MATERIAL = "insufficient_material"
-    FIFTY_MOVE_RULE = "fifty_move_rule"
-    THREEFOLD_REPETITION = "threefold_repetition"
 
+BOARD_CACHE_SIZE = 256
+_board_cache: LRUCache[chess.Board] = LRUCache(maxsize=BOARD_CACHE_SIZE)
 
-@dataclass
-class MoveResult:
-    """Result of applying a move."""
+
+def cached_board(fen: str) -> chess.Board:
+    """
+    Parse a FEN into a shared template board, memoized per FEN string.
+
+    The returned board is shared between callers and must not be modified.
+    Anything that pushes moves, even temporarily (san(), can_claim_*()),
+    works on ``cached_board(fen).copy(stack=False)`` instead.
+
+    Cached boards may have a non-empty move stack (apply_move stores its
+    board after pushing the move), so callers must not read ``move_stack``
+    or anything derived from it; only the position itself is meaningful.
+
+    Raises:
+        ValueError: If the FEN is invalid (not cached)
+    """
+    board = _board_cache.get(fen)
+    if board is None:
+        board = chess.Board(fen)
+        _board_cache.put(fen, board)
+    return board
+
+
+# FEN placement -> board_ascii rank: digits become runs of empty squares and
+# crazyhouse promotion markers are dropped, as str(board) does
+_ASCII_RANK = str.maketrans({**{str(n): "." * n for n in range(1, 9)}, "~": None})
+
+
+@lru_cache(maxsize=BOARD_CACHE_SIZE)
+def position_key(fen: str) -> tuple[int, int]:
+    """
+    Cache key for engine results: polyglot Zobrist hash plus halfmove clock.
+
+    The Zobrist hash covers placement, side to move, castling rights and
+    capturable en passant squares, so FENs that differ only in move number
+    or a dead en passant square share a key. The halfmove clock is kept
+    since Stockfish scales its evaluation toward the fifty-move rule.
+    Keys are memoized per FEN: a turn looks up the same few positions in
+    several caches, and hashing walks every piece on the board.
+
+    Raises:
+        ValueError: If the FEN is invalid
+    """
+    board = cached_board(fen)
+    return chess.polyglot.zobrist_hash(board), board.halfmove_clock
+
+
+class MoveResult(NamedTuple):
+    """Result of applying a move (a plain tuple; built by trusted code only)."""
     success: bool
     new_fen: Optional[str] = None
     san: Optional[str] = None  # Standard Algebraic Notation
@@ -33,7 +84,7 @@ class MoveResult:
     is_checkmate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GameStatus:
     """Current game status."""
     status: GameStatusType
@@ -44,6 +95,14 @@ class GameStatus:
     halfmove_clock: int = 0
 
 
+# (status, is_game_over, winner) per position_key; the halfmove clock is part
+# of the key, so fifty/seventy-five move verdicts are cached correctly too
+STATUS_CACHE_SIZE = 512
+_status_cache: LRUCache[tuple[GameStatusType, bool, Optional[str]]] = LRUCache(
+    maxsize=STATUS_CACHE_SIZE
+)
+
+
 class ChessStateService:
     """Service for managing chess game state using python-chess."""
 
@@ -61,11 +120,13 @@ class ChessStateService:
             MoveResult with new FEN or error message
         """
         try:
-            board = chess.Board(fen)
+            board = cached_board(fen).copy(stack=False)
         except ValueError as e:
             return MoveResult(success=False, error=f"Invalid FEN: {e}")
 
-        # Try parsing as UCI first, then SAN
+        # Try parsing as UCI first, then SAN. Each path checks legality once:
+        # `in legal_moves` tests the single move and parse_san only returns
+        # legal moves (or the null move, which is falsy)
         chess_move = None
         try:
             chess_move = chess.Move.from_uci(move)
@@ -77,31 +138,39 @@ class ChessStateService:
         if chess_move is None:
             try:
                 chess_move = board.parse_san(move)
+            except chess.IllegalMoveError:
+                chess_move = None
             except (chess.InvalidMoveError, chess.AmbiguousMoveError) as e:
                 return MoveResult(success=False, error=f"Invalid move '{move}': {e}")
 
-        if chess_move not in board.legal_moves:
+        if not chess_move:
             return MoveResult(
                 success=False,
                 error=f"Illegal move '{move}'. Legal moves: {self._format_legal_moves(board)}"
             )
 
         # Get move info before applying
-        san = board.san(chess_move)
         uci = chess_move.uci()
         is_capture = board.is_capture(chess_move)
 
-        # Apply the move
-        board.push(chess_move)
+        # Apply the move; the SAN suffix already encodes check and mate
+        san = board.san_and_push(chess_move)
+        new_fen = board.fen()
+
+        # The resulting position is about to become the current one, which
+        # every tool then asks about; seed the cache so it is never parsed.
+        # This board is private to the call, so it is stored uncopied, with
+        # the played move still on its stack (see cached_board)
+        _board_cache.put(new_fen, board)
 
         return MoveResult(
             success=True,
-            new_fen=board.fen(),
+            new_fen=new_fen,
             san=san,
             uci=uci,
             is_capture=is_capture,
-            is_check=board.is_check(),
-            is_checkmate=board.is_checkmate(),
+            is_check=san[-1] in "+#",
+            is_checkmate=san[-1] == "#",
         )
 
     def legal_moves(self, fen: str, format: str = "both") -> dict:
@@ -116,18 +185,19 @@ class ChessStateService:
             Dictionary with legal moves in requested format(s)
         """
         try:
-            board = chess.Board(fen)
+            board = cached_board(fen).copy(stack=False)
         except ValueError as e:
             return {"error": f"Invalid FEN: {e}", "moves": []}
 
-        moves_uci = [m.uci() for m in board.legal_moves]
-        moves_san = [board.san(m) for m in board.legal_moves]
-
-        result = {"count": len(moves_uci)}
+        legal = list(board.legal_moves)
+        result = {"count": len(legal)}
 
+        # SAN needs check/mate detection per move, so skip it unless asked for
         if format in ("uci", "both"):
+            moves_uci = [m.uci() for m in legal]
             result["uci"] = moves_uci
         if format in ("san", "both"):
+            moves_san = [board.san(m) for m in legal]
             result["san"] = moves_san
         if format == "both":
             result["pairs"] = [
@@ -147,44 +217,68 @@ class ChessStateService:
             GameStatus with current state information
         """
         try:
-            board = chess.Board(fen)
+            board = cached_board(fen)
+            key = position_key(fen)
         except ValueError:
             return GameStatus(
-                status=GameStatusType.ONGOING,
+                status=ONGOING,
                 turn="white",
                 is_game_over=False,
                 fullmove_number=1,
                 halfmove_clock=0,
             )
 
-        turn = "white" if board.turn == chess.WHITE else "black"
+        outcome = _status_cache.get(key)
+        if outcome is None:
+            # can_claim_*() push moves, so classify on a private copy
+            outcome = self._classify_position(board.copy(stack=False))
+            _status_cache.put(key, outcome)
+        status, is_game_over, winner = outcome
+
+        return GameStatus(
+            status=status,
+            turn="white" if board.turn == chess.WHITE else "black",
+            is_game_over=is_game_over,
+            winner=winner,
+            fullmove_number=board.fullmove_number,
+            halfmove_clock=board.halfmove_clock,
+        )
+
+    @staticmethod
+    def _classify_position(board: chess.Board) -> tuple[GameStatusType, bool, Optional[str]]:
+        """Return (status, is_game_over, winner) for a position."""
         winner = None
 
-        if board.is_checkmate():
-            status = GameStatusType.CHECKMATE
+        # Generate legal moves (lazily, stopping at the first) and test for
+        # check once; checkmate, stalemate and game over all derive from them
+        has_legal_moves = any(board.generate_legal_moves())
+        in_check = board.is_check()
+        insufficient = board.is_insufficient_material()
+
+        if not has_legal_moves and in_check:
+            status = CHECKMATE
             winner = "black" if board.turn == chess.WHITE else "white"
-        elif board.is_stalemate():
-            status = GameStatusType.STALEMATE
-        elif board.is_insufficient_material():
-            status = GameStatusType.INSUFFICIENT_MATERIAL
+        elif not has_legal_moves:
+            status = STALEMATE
+        elif insufficient:
+            status = INSUFFICIENT_MATERIAL
         elif board.can_claim_fifty_moves():
-            status = GameStatusType.FIFTY_MOVE_RULE
+            status = FIFTY_MOVE_RULE
         elif board.can_claim_threefold_repetition():
-            status = GameStatusType.THREEFOLD_REPETITION
-        elif board.is_check():
-            status = GameStatusType.CHECK
+            status = THREEFOLD_REPETITION
+        elif in_check:
+            status = CHECK
         else:
-            status = GameStatusType.ONGOING
+            status = ONGOING
 
-        return GameStatus(
-            status=status,
-            turn=turn,
-            is_game_over=board.is_game_over(),
-            winner=winner,
-            fullmove_number=board.fullmove_number,
-            halfmove_clock=board.halfmove_clock,
+        # Same outcome as board.is_game_over(); a FEN carries no move
+        # history, so fivefold repetition cannot apply
+        is_game_over = (
+            not has_legal_moves or insufficient or board.is_seventyfive_moves()
         )
 
+        return status, is_game_over, winner
+
     def fen_from_pgn(self, pgn: str) -> dict:
         """
         Parse PGN and return the final position FEN.
@@ -205,10 +299,10 @@ class ChessStateService:
             board = game.board()
             moves = []
 
+            # san_and_push renders SAN while making the move, instead of
+            # san() pushing and popping it only for push() to repeat it
             for move in game.mainline_moves():
-                san = board.san(move)
-                moves.append({"san": san, "uci": move.uci()})
-                board.push(move)
+                moves.append({"san": board.san_and_push(move), "uci": move.uci()})
 
             return {
                 "fen": board.fen(),
@@ -229,14 +323,19 @@ class ChessStateService:
             ASCII art representation of the board
         """
         try:
-            board = chess.Board(fen)
-            return str(board)
+            cached_board(fen)  # Validates the FEN (and is cached for the tools)
         except ValueError:
             return "Invalid FEN"
 
+        # Same layout as str(board), rendered straight from the FEN's
+        # placement field instead of 64 piece_at() lookups
+        placement = fen.split(None, 1)[0]
+        return "\n".join(" ".join(rank.translate(_ASCII_RANK)) for rank in placement.split("/"))
+
     def _format_legal_moves(self, board: chess.Board, max_moves: int = 10) -> str:
         """Format legal moves for error messages."""
-        moves = [board.san(m) for m in list(board.legal_moves)[:max_moves]]
-        if len(list(board.legal_moves)) > max_moves:
-            moves.append(f"... ({len(list(board.legal_moves))} total)")
+        legal = list(board.legal_moves)
+        moves = [board.san(m) for m in legal[:max_moves]]
+        if len(legal) > max_moves:
+            moves.append(f"... ({len(legal)} total)")
         return ", ".join(moves)
@@ -1,36 +1,47 @@
 """Stockfish chess engine service."""
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+import inspect
+import os
 import shutil
+import threading
 
 import chess
 from stockfish import Stockfish
 
-
-class MoveClassification(str, Enum):
-    """Classification of move quality."""
-    BRILLIANT = "brilliant"
-    GREAT = "great"
-    BEST = "best"
-    EXCELLENT = "excellent"
-    GOOD = "good"
-    INACCURACY = "inaccuracy"
-    MISTAKE = "mistake"
-    BLUNDER = "blunder"
-    BOOK = "book"
-
-
-@dataclass
+from ..utils.schemas import (
+    BEST,
+    BLUNDER,
+    BRILLIANT,
+    EXCELLENT,
+    GOOD,
+    GREAT,
+    INACCURACY,
+    MISTAKE,
+    MoveClassification,
+)
+from .chess_state import cached_board
+
+# stockfish<4 sends ucinewgame (clearing the hash table) on every
+# set_fen_position unless told not to; 4.x dropped both the token and the flag
+_FEN_KWARGS = (
+    {"send_ucinewgame_token": False}
+    if "send_ucinewgame_token" in inspect.signature(Stockfish.set_fen_position).parameters
+    else {}
+)
+
+
+@dataclass(slots=True)
 class LineAnalysis:
     """Analysis of a single variation line."""
     move: str  # Best move in UCI
     move_san: Optional[str] = None  # Best move in SAN (if available)
     centipawn: Optional[int] = None  # Evaluation in centipawns
     mate_in: Optional[int] = None  # Mate in N moves (positive = winning)
-    pv: list[str] = field(default_factory=list)  # Principal variation (UCI)
-    pv_san: list[str] = field(default_factory=list)  # Principal variation (SAN)
+    pv: tuple[str, ...] = ()  # Principal variation (UCI)
+    pv_san: tuple[str, ...] = ()  # Principal variation (SAN)
 
     @property
     def eval_string(self) -> str:
@@ -43,7 +54,7 @@ class LineAnalysis:
         return "?"
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionAnalysis:
     """Full analysis of a position."""
     fen: str
@@ -67,7 +78,7 @@ class PositionAnalysis:
         return "?"
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveEvaluation:
     """Evaluation of a specific move."""
     move: str
@@ -75,7 +86,7 @@ class MoveEvaluation:
     prev_eval: Optional[float] = None  # Eval before move
     new_eval: Optional[float] = None  # Eval after move
     delta: Optional[float] = None  # Change in evaluation
-    classification: MoveClassification = MoveClassification.GOOD
+    classification: MoveClassification = GOOD
     best_move: Optional[str] = None  # What was the best move
     best_move_san: Optional[str] = None
     explanation: str = ""
@@ -91,11 +102,39 @@ class StockfishService:
         "inaccuracy": 50,  # Loses >= 0.5 pawns
     }
 
+    # Centipawn stand-in for a forced mate when comparing evaluations
+    MATE_CP = 10000
+
+    # Explanation per classification; {best_move} is filled in only for the
+    # template that is actually used
+    EXPLANATION_TEMPLATES = {
+        BRILLIANT: "An exceptional move that creates winning chances!",
+        BEST: "This is the engine's top choice.",
+        EXCELLENT: "A very strong move.",
+        GREAT: "A strong move that maintains advantage.",
+        GOOD: "A solid move.",
+        INACCURACY: "Slightly imprecise. Better was {best_move}.",
+        MISTAKE: "This loses material or position. Better was {best_move}.",
+        BLUNDER: "A serious error! {best_move} was much better.",
+    }
+
+    # Classifications whose explanation also reports the eval change
+    EVAL_CHANGE_CLASSIFICATIONS = frozenset({
+        INACCURACY,
+        MISTAKE,
+        BLUNDER,
+    })
+
+    # Niceness requested for a pinned engine (needs CAP_SYS_NICE to take effect)
+    PINNED_NICE = -5
+
     def __init__(
         self,
         path: Optional[str] = None,
         depth: int = 15,
         multipv: int = 3,
+        hash_mb: Optional[int] = None,
+        cpu_core: Optional[int] = None,
     ):
         """
         Initialize Stockfish service.
@@ -104,6 +143,8 @@ class StockfishService:
             path: Path to Stockfish binary (auto-detect if None)
             depth: Default analysis depth
             multipv: Default number of lines to analyze
+            hash_mb: Transposition table size in MB (engine default if None)
+            cpu_core: CPU to pin the engine process to (Linux only, None to skip)
         """
         self.default_depth = depth
         self.default_multipv = multipv
@@ -117,8 +158,16 @@ class StockfishService:
                     "apt install stockfish (Linux) or brew install stockfish (macOS)"
                 )
 
-        self._engine = Stockfish(path=path)
-        self._engine.set_depth(depth)
+        # Hash is sized once here and kept for the life of the process; only
+        # reset() clears it, so consecutive positions reuse the search tree
+        parameters = {"Hash": hash_mb} if hash_mb else None
+        self._engine = Stockfish(path=path, depth=depth, parameters=parameters)
+        if cpu_core is not None:
+            self._pin(cpu_core)
+
+        # One UCI process can only run one search at a time; callers on
+        # several threads (parallel tool calls, prefetch) take turns
+        self._lock = threading.Lock()
 
     def analyze(
         self,
@@ -140,54 +189,15 @@ class StockfishService:
         depth = depth or self.default_depth
         multipv = multipv or self.default_multipv
 
-        self._engine.set_fen_position(fen)
-        self._engine.set_depth(depth)
-
-        # Get top N lines
-        top_moves = self._engine.get_top_moves(multipv)
-
-        lines = []
-        for move_info in top_moves:
-            centipawn = move_info.get("Centipawn")
-            mate = move_info.get("Mate")
-
-            line = LineAnalysis(
-                move=move_info["Move"],
-                centipawn=centipawn,
-                mate_in=mate,
-            )
-            lines.append(line)
-
-        # Get best move
-        best_move = self._engine.get_best_move()
-
-        # Get evaluation
-        eval_info = self._engine.get_evaluation()
-        evaluation = None
-        mate_in = None
+        with self._lock:
+            self._engine.set_fen_position(fen, **_FEN_KWARGS)
+            self._engine.set_depth(depth)
 
-        if eval_info["type"] == "cp":
-            evaluation = eval_info["value"] / 100
-        elif eval_info["type"] == "mate":
-            mate_in = eval_info["value"]
-
-        # Check game state (use python-chess; wrapper APIs vary by version)
-        board = chess.Board(fen)
-        is_check = board.is_check()
-        is_checkmate = board.is_checkmate()
-        is_stalemate = board.is_stalemate()
+            # One multipv search; its first line is the best move and the
+            # position's evaluation, so no separate bestmove/eval searches
+            lines = self._top_lines(multipv)
 
-        return PositionAnalysis(
-            fen=fen,
-            depth=depth,
-            lines=lines,
-            best_move=best_move or "",
-            evaluation=evaluation,
-            mate_in=mate_in,
-            is_check=is_check,
-            is_checkmate=is_checkmate,
-            is_stalemate=is_stalemate,
-        )
+        return self._position_analysis(fen, cached_board(fen), depth, lines)
 
     def evaluate_move(
         self,
@@ -206,96 +216,174 @@ class StockfishService:
         Returns:
             MoveEvaluation with classification and delta
         """
-        depth = depth or self.default_depth
+        # Same two searches as the combined call, with a single line after
+        # the move since only its eval is needed
+        return self.analyze_with_played_move(prev_fen, move, depth, multipv=1)[0]
+
+    def analyze_with_played_move(
+        self,
+        prev_fen: str,
+        move: str,
+        depth: Optional[int] = None,
+        multipv: Optional[int] = None,
+    ) -> tuple[MoveEvaluation, Optional[PositionAnalysis]]:
+        """
+        Evaluate a move and analyze the position it leads to in two searches.
 
-        # Analyze position before move
-        self._engine.set_fen_position(prev_fen)
-        self._engine.set_depth(depth)
+        The root search supplies the best move and the eval before the move;
+        the multipv search of the resulting position supplies both its
+        analysis and the eval after the move. Running them back to back on
+        one engine lets the second search reuse the first one's hash table,
+        instead of the separate searches evaluate_move and analyze make.
 
-        best_move = self._engine.get_best_move()
-        eval_before = self._engine.get_evaluation()
+        Args:
+            prev_fen: Position before the move
+            move: Move in UCI notation
+            depth: Analysis depth (uses default if None)
+            multipv: Number of lines for the resulting position (uses default if None)
+
+        Returns:
+            (MoveEvaluation, PositionAnalysis of the new position); the
+            analysis is None if the move is invalid
+        """
+        depth = depth or self.default_depth
+        multipv = multipv or self.default_multipv
 
-        # Apply the move and analyze
-        if not self._engine.is_move_correct(move):
+        board = cached_board(prev_fen).copy(stack=False)
+        try:
+            played = chess.Move.from_uci(move)
+        except ValueError:
+            played = None
+        if played is None or played not in board.legal_moves:
             return MoveEvaluation(
                 move=move,
-                classification=MoveClassification.BLUNDER,
+                classification=BLUNDER,
                 explanation=f"Invalid move: {move}",
-            )
-
-        self._engine.make_moves_from_current_position([move])
-        eval_after = self._engine.get_evaluation()
+            ), None
+        board.push(played)
+        new_fen = board.fen()
+
+        with self._lock:
+            self._engine.set_fen_position(prev_fen, **_FEN_KWARGS)
+            self._engine.set_depth(depth)
+            root = self._top_lines(1)
+
+            # The FEN is already known locally; make_moves_from_current_position
+            # would first ask the engine for its position. The hash table is
+            # kept, so this search reuses the root search's entries
+            self._engine.set_fen_position(new_fen, **_FEN_KWARGS)
+            lines = self._top_lines(multipv)
+
+        best_move = root[0].move if root else None
+        prev_cp = self._line_cp(root[0]) if root else None
+
+        # Lines are from the opponent's perspective after the move; with no
+        # lines the game is over, so the mover gave mate or stalemate
+        if lines:
+            new_cp = self._line_cp(lines[0])
+            if new_cp is not None:
+                new_cp = -new_cp
+        else:
+            new_cp = self.MATE_CP if board.is_checkmate() else 0
 
-        # Calculate evaluation delta
-        prev_eval = self._extract_eval(eval_before)
-        new_eval = self._extract_eval(eval_after)
+        # Integer centipawns throughout; pawns only for the reported fields
+        delta_cp = None
+        if prev_cp is not None and new_cp is not None:
+            delta_cp = new_cp - prev_cp
+        delta = delta_cp / 100 if delta_cp is not None else None
 
-        # Flip sign since evaluation is from the opponent's perspective after move
-        if new_eval is not None:
-            new_eval = -new_eval
+        classification = self._classify_move(move, best_move, delta_cp)
+        evaluation = MoveEvaluation(
+            move=move,
+            prev_eval=prev_cp / 100 if prev_cp is not None else None,
+            new_eval=new_cp / 100 if new_cp is not None else None,
+            delta=delta,
+            classification=classification,
+            best_move=best_move,
+            explanation=self._generate_explanation(classification, delta, best_move, move),
+        )
 
-        delta = None
-        if prev_eval is not None and new_eval is not None:
-            delta = new_eval - prev_eval
+        return evaluation, self._position_analysis(new_fen, board, depth, lines)
 
-        # Classify the move
-        classification = self._classify_move(move, best_move, delta, prev_eval, new_eval)
+    def _position_analysis(
+        self,
+        fen: str,
+        board: chess.Board,
+        depth: int,
+        lines: list[LineAnalysis],
+    ) -> PositionAnalysis:
+        """Build a PositionAnalysis from a search's top lines (best line first)."""
+        # Check game state (use python-chess; wrapper APIs vary by version)
+        is_checkmate = board.is_checkmate()
+        is_stalemate = board.is_stalemate()
 
-        explanation = self._generate_explanation(
-            classification, delta, best_move, move
-        )
+        if lines:
+            top = lines[0]
+            best_move = top.move
+            mate_in = top.mate_in
+            evaluation = top.centipawn / 100 if top.centipawn is not None else None
+        else:
+            # No legal moves: the engine reports mate 0 or a draw score
+            best_move = ""
+            mate_in = 0 if is_checkmate else None
+            evaluation = 0.0 if is_stalemate else None
 
-        return MoveEvaluation(
-            move=move,
-            prev_eval=prev_eval,
-            new_eval=new_eval,
-            delta=delta,
-            classification=classification,
+        return PositionAnalysis(
+            fen=fen,
+            depth=depth,
+            lines=lines,
             best_move=best_move,
-            explanation=explanation,
+            evaluation=evaluation,
+            mate_in=mate_in,
+            is_check=board.is_check(),
+            is_checkmate=is_checkmate,
+            is_stalemate=is_stalemate,
         )
 
-    def _extract_eval(self, eval_info: dict) -> Optional[float]:
-        """Extract evaluation as float (in pawns)."""
-        if eval_info["type"] == "cp":
-            return eval_info["value"] / 100
-        elif eval_info["type"] == "mate":
-            # Convert mate to a large value
-            mate_val = eval_info["value"]
-            return 100 if mate_val > 0 else -100
-        return None
+    def _top_lines(self, multipv: int) -> list[LineAnalysis]:
+        """Search the engine's current position and return its top lines."""
+        return [
+            LineAnalysis(
+                move=move_info["Move"],
+                centipawn=move_info.get("Centipawn"),
+                mate_in=move_info.get("Mate"),
+            )
+            for move_info in self._engine.get_top_moves(multipv)
+        ]
+
+    def _line_cp(self, line: LineAnalysis) -> Optional[int]:
+        """Extract a line's evaluation in centipawns (mate as +/-MATE_CP)."""
+        if line.mate_in is not None:
+            return self.MATE_CP if line.mate_in > 0 else -self.MATE_CP
+        return line.centipawn
 
     def _classify_move(
         self,
         move: str,
         best_move: Optional[str],
-        delta: Optional[float],
-        prev_eval: Optional[float],
-        new_eval: Optional[float],
+        delta_cp: Optional[int],
     ) -> MoveClassification:
-        """Classify a move based on evaluation change."""
+        """Classify a move based on evaluation change (in centipawns)."""
         # Best move check
         if move == best_move:
-            if delta is not None and delta > 0.5:
-                return MoveClassification.BRILLIANT
-            return MoveClassification.BEST
-
-        if delta is None:
-            return MoveClassification.GOOD
-
-        # Convert delta to centipawns for threshold comparison
-        delta_cp = abs(delta * 100)
-
-        if delta_cp >= self.THRESHOLDS["blunder"]:
-            return MoveClassification.BLUNDER
-        elif delta_cp >= self.THRESHOLDS["mistake"]:
-            return MoveClassification.MISTAKE
-        elif delta_cp >= self.THRESHOLDS["inaccuracy"]:
-            return MoveClassification.INACCURACY
-        elif delta >= 0:
-            return MoveClassification.EXCELLENT
+            if delta_cp is not None and delta_cp > 50:
+                return BRILLIANT
+            return BEST
+
+        if delta_cp is None:
+            return GOOD
+
+        loss = abs(delta_cp)
+        if loss >= self.THRESHOLDS["blunder"]:
+            return BLUNDER
+        elif loss >= self.THRESHOLDS["mistake"]:
+            return MISTAKE
+        elif loss >= self.THRESHOLDS["inaccuracy"]:
+            return INACCURACY
+        elif delta_cp >= 0:
+            return EXCELLENT
         else:
-            return MoveClassification.GOOD
+            return GOOD
 
     def _generate_explanation(
         self,
@@ -305,29 +393,134 @@ class StockfishService:
         played_move: str,
     ) -> str:
         """Generate explanation for move classification."""
-        explanations = {
-            MoveClassification.BRILLIANT: "An exceptional move that creates winning chances!",
-            MoveClassification.BEST: "This is the engine's top choice.",
-            MoveClassification.EXCELLENT: "A very strong move.",
-            MoveClassification.GREAT: "A strong move that maintains advantage.",
-            MoveClassification.GOOD: "A solid move.",
-            MoveClassification.INACCURACY: f"Slightly imprecise. Better was {best_move}.",
-            MoveClassification.MISTAKE: f"This loses material or position. Better was {best_move}.",
-            MoveClassification.BLUNDER: f"A serious error! {best_move} was much better.",
-        }
-
-        base = explanations.get(classification, "")
-
-        if delta is not None and classification in (
-            MoveClassification.INACCURACY,
-            MoveClassification.MISTAKE,
-            MoveClassification.BLUNDER,
-        ):
+        if classification not in self.EVAL_CHANGE_CLASSIFICATIONS:
+            # No placeholders outside the eval-change classifications
+            return self.EXPLANATION_TEMPLATES.get(classification, "")
+
+        base = self.EXPLANATION_TEMPLATES[classification].format(best_move=best_move)
+
+        if delta is not None:
             base += f" (eval change: {delta:+.2f})"
 
         return base
 
+    def _pin(self, cpu_core: int) -> None:
+        """Pin the engine process to one CPU and raise its priority (best effort)."""
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        pid = self._engine._stockfish.pid
+        try:
+            os.sched_setaffinity(pid, {cpu_core})
+        except OSError:
+            return
+        try:
+            os.setpriority(os.PRIO_PROCESS, pid, self.PINNED_NICE)
+        except OSError:
+            # Unprivileged processes may not lower niceness; pinning still helps
+            pass
+
+    def reset(self) -> None:
+        """Reset the engine for a new game without respawning the process."""
+        with self._lock:
+            self._engine.send_ucinewgame_command()
+            self._engine.set_fen_position(chess.STARTING_FEN, **_FEN_KWARGS)
+
     def close(self):
         """Close the Stockfish engine."""
         if hasattr(self, '_engine'):
             del self._engine
+
+
+class StockfishPool:
+    """
+    Thread-safe pool of warm StockfishService instances.
+
+    Engines are spawned lazily up to ``maxsize`` and reset (``ucinewgame`` +
+    start position) when released, so callers reuse a running process
+    instead of paying spawn + UCI handshake for every session.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        depth: int = 15,
+        multipv: int = 3,
+        maxsize: Optional[int] = None,
+        hash_mb: Optional[int] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            path: Path to Stockfish binary (auto-detect if None)
+            depth: Default analysis depth for pooled engines
+            multipv: Default number of lines for pooled engines
+            maxsize: Maximum number of engines (defaults to CPU count)
+            hash_mb: Transposition table size in MB for each pooled engine
+        """
+        self.path = path
+        self.depth = depth
+        self.multipv = multipv
+        self.hash_mb = hash_mb
+        self.maxsize = maxsize or os.cpu_count() or 1
+
+        self._idle: list[StockfishService] = []
+        self._created = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> StockfishService:
+        """Check out an engine, spawning one if none is idle and below maxsize."""
+        with self._cond:
+            while not self._idle and self._created >= self.maxsize:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return StockfishService(
+                path=self.path,
+                depth=self.depth,
+                multipv=self.multipv,
+                hash_mb=self.hash_mb,
+            )
+        except Exception:
+            self._discard()
+            raise
+
+    def release(self, service: StockfishService) -> None:
+        """Reset an engine and return it to the pool."""
+        try:
+            service.reset()
+        except Exception:
+            # Engine is unusable (e.g. process died) - drop it
+            service.close()
+            self._discard()
+            return
+
+        with self._cond:
+            self._idle.append(service)
+            self._cond.notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[StockfishService]:
+        """Context manager that acquires an engine and releases it on exit."""
+        service = self.acquire()
+        try:
+            yield service
+        finally:
+            self.release(service)
+
+    def close(self) -> None:
+        """Close all idle engines."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for service in idle:
+            service.close()
+
+    def _discard(self) -> None:
+        """Forget an engine slot so a replacement can be spawned."""
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
@@ -1,9 +1,10 @@
 """Utility modules."""
 
-from .config import settings
+from .cache import LRUCache
 from .schemas import TutorPlan, MoveResult, PositionAnalysis, MoveEvaluation, GameStatus
 
 __all__ = [
+    "LRUCache",
     "settings",
     "TutorPlan",
     "MoveResult",
@@ -11,3 +12,11 @@ __all__ = [
     "MoveEvaluation",
     "GameStatus",
 ]
+
+
+def __getattr__(name: str):
+    """Defer loading settings until first use (see config.__getattr__)."""
+    if name == "settings":
+        from .config import get_settings
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,48 @@
-"""Configuration management using pydantic-settings."""
+"""Configuration management from environment variables and .env."""
 
+import os
+from dataclasses import dataclass, fields
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Callable, Optional, Union, get_args, get_origin
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
+ENV_FILE = ".env"
+
+# Accepted spellings for boolean settings (case-insensitive, as pydantic)
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean setting."""
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean: {value!r}")
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+_PARSERS: dict[type, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: int,
+    float: float,
+    str: str,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from environment variables."""
 
     # OpenAI Configuration
     openai_api_key: str = ""
     openai_model: str = "gpt-4o"
     openai_temperature: float = 0.7
     openai_max_tokens: int = 2048
+    openai_json_mode: bool = True  # Request response_format=json_object
+    max_history_tokens: int = 8000  # Approximate budget for resent history
 
     # vLLora Gateway Configuration
     use_local_gateway: bool = False
@@ -30,6 +52,8 @@ class Settings(BaseSettings):
     stockfish_path: Optional[str] = None  # Auto-detect if None
     stockfish_depth: int = 15
     stockfish_multipv: int = 3
+    stockfish_hash_mb: int = 128  # Transposition table, sized once per engine
+    stockfish_cpu_core: Optional[int] = None  # Pin engine to this CPU (Linux)
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -51,12 +75,57 @@ class Settings(BaseSettings):
             return True
         return bool(self.openai_api_key and self.openai_api_key != "your-openai-api-key-here")
 
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ENV_FILE) -> "Settings":
+        """
+        Build settings from the environment, falling back to env_file.
+
+        Names match fields case-insensitively and process environment
+        variables take precedence over the file.
+        An empty value leaves an Optional setting unset.
+
+        Raises:
+            ValueError: If a value cannot be parsed as the field's type
+        """
+        values = {}
+        if env_file and os.path.exists(env_file):
+            values.update(
+                (key.lower(), value)
+                for key, value in dotenv_values(env_file, encoding="utf-8").items()
+                if value is not None
+            )
+        values.update((key.lower(), value) for key, value in os.environ.items())
+
+        kwargs = {}
+        for field in fields(cls):
+            raw = values.get(field.name)
+            if raw is None:
+                continue
+
+            field_type, optional = field.type, False
+            if get_origin(field_type) is Union:
+                field_type = next(t for t in get_args(field_type) if t is not type(None))
+                optional = True
+            if optional and not raw.strip():
+                kwargs[field.name] = None
+                continue
+
+            try:
+                kwargs[field.name] = _PARSERS[field_type](raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {field.name.upper()}: {e}") from None
+
+        return cls(**kwargs)
+
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings.from_env()
 
 
-# Default settings instance
-settings = get_settings()
+def __getattr__(name: str):
+    """Resolve ``settings`` on first access (PEP 562), not at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,11 @@
 """System and turn prompts for the chess tutor."""
 
+from itertools import zip_longest
 from typing import Optional
 
+# Keep this free of per-session values (thread IDs, timestamps, user level):
+# it is sent verbatim as the first message of every request, so backends with
+# prefix caching can reuse its KV cache across sessions.
 SYSTEM_PROMPT = """You are an expert chess tutor helping a student improve their chess skills. Your role is to:
 
 1. ANALYZE positions using the analyze_position tool
@@ -60,16 +64,15 @@ def _format_game_history(game_history: list[dict]) -> str:
     if not game_history:
         return ""
 
-    moves = []
-    for i, move in enumerate(game_history):
-        move_num = (i // 2) + 1
-        san = move.get('san', move.get('move', '?'))
-        if i % 2 == 0:
-            moves.append(f"{move_num}. {san}")
-        else:
-            moves[-1] += f" {san}"
+    sans = [move.get('san', move.get('move', '?')) for move in game_history]
 
-    return f"\nGame moves so far: {' '.join(moves)}"
+    # Pair white and black moves; a trailing white move has no partner
+    moves = " ".join(
+        f"{move_num}. {white} {black}" if black is not None else f"{move_num}. {white}"
+        for move_num, (white, black) in enumerate(zip_longest(sans[::2], sans[1::2]), 1)
+    )
+
+    return f"\nGame moves so far: {moves}"
 
 
 def make_turn_prompt(
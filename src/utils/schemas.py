@@ -1,52 +1,167 @@
 """Pydantic schemas for chess tutor."""
 
-from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal, Mapping, Optional, get_args
+from pydantic import BaseModel, ConfigDict, computed_field, field_validator, model_validator
 
 
 # ============================================================================
 # Chess Domain Models
 # ============================================================================
 
-class GameStatusType(str, Enum):
-    """Game status types."""
-    ONGOING = "ongoing"
-    CHECK = "check"
-    CHECKMATE = "checkmate"
-    STALEMATE = "stalemate"
-    INSUFFICIENT_MATERIAL = "insufficient_material"
-    FIFTY_MOVE_RULE = "fifty_move_rule"
-    THREEFOLD_REPETITION = "threefold_repetition"
-
-
-class MoveClassification(str, Enum):
-    """Classification of move quality."""
-    BRILLIANT = "brilliant"
-    GREAT = "great"
-    BEST = "best"
-    EXCELLENT = "excellent"
-    GOOD = "good"
-    INACCURACY = "inaccuracy"
-    MISTAKE = "mistake"
-    BLUNDER = "blunder"
-    BOOK = "book"
-
-
-class MoveResult(BaseModel):
-    """Result of applying a move."""
-    success: bool
+# Plain strings validated against a Literal set: pydantic-core checks set
+# membership instead of running the Enum validator, and values need no
+# .value unwrapping when compared or serialized
+
+# Game status types
+GameStatusType = Literal[
+    "ongoing",
+    "check",
+    "checkmate",
+    "stalemate",
+    "insufficient_material",
+    "fifty_move_rule",
+    "threefold_repetition",
+]
+ONGOING: GameStatusType = "ongoing"
+CHECK: GameStatusType = "check"
+CHECKMATE: GameStatusType = "checkmate"
+STALEMATE: GameStatusType = "stalemate"
+INSUFFICIENT_MATERIAL: GameStatusType = "insufficient_material"
+FIFTY_MOVE_RULE: GameStatusType = "fifty_move_rule"
+THREEFOLD_REPETITION: GameStatusType = "threefold_repetition"
+
+# Classification of move quality
+MoveClassification = Literal[
+    "brilliant",
+    "great",
+    "best",
+    "excellent",
+    "good",
+    "inaccuracy",
+    "mistake",
+    "blunder",
+    "book",
+]
+BRILLIANT: MoveClassification = "brilliant"
+GREAT: MoveClassification = "great"
+BEST: MoveClassification = "best"
+EXCELLENT: MoveClassification = "excellent"
+GOOD: MoveClassification = "good"
+INACCURACY: MoveClassification = "inaccuracy"
+MISTAKE: MoveClassification = "mistake"
+BLUNDER: MoveClassification = "blunder"
+BOOK: MoveClassification = "book"
+
+# Display label per classification, built once for renderers
+CLASSIFICATION_LABELS: dict[MoveClassification, str] = {
+    c: c.upper() for c in get_args(MoveClassification)
+}
+
+
+# Engine evaluations cluster on a small set of values, so the formatted
+# strings are shared across models instead of rebuilt per instance
+@lru_cache(maxsize=64)
+def _format_mate(mate_in: int) -> str:
+    return "M%d" % mate_in if mate_in > 0 else "-M%d" % -mate_in
+
+
+@lru_cache(maxsize=4096)
+def _format_pawns(pawns: float) -> str:
+    return "%+.2f" % pawns
+
+
+class SchemaModel(BaseModel):
+    """
+    Base for the schema models, carrying their JSON schema built at import.
+
+    JSON_SCHEMA is generated once because pydantic rebuilds the schema on
+    every model_json_schema() call. Only its top level is read-only: nested
+    dicts and lists are shared by every reader, so callers that need to
+    edit the schema must copy.deepcopy() it first.
+    """
+    JSON_SCHEMA: ClassVar[Mapping[str, Any]]
+
+
+# MoveResult flag bits; combine with | and test with &
+FLAG_SUCCESS = 1
+FLAG_CAPTURE = 2
+FLAG_CHECK = 4
+
+_MOVE_RESULT_FLAGS = {
+    "success": FLAG_SUCCESS,
+    "is_capture": FLAG_CAPTURE,
+    "is_check": FLAG_CHECK,
+}
+# Inputs _pack_flags rewrites; anything else passes through untouched
+_MOVE_RESULT_INPUTS = frozenset({*_MOVE_RESULT_FLAGS, "is_checkmate", "status"})
+
+
+class MoveResult(SchemaModel):
+    """
+    Result of applying a move.
+
+    success, is_capture and is_check are packed into flags; the resulting
+    position's state (checkmate, stalemate, draws) is in status. Check is
+    a flag rather than a status because a checking move can also end the
+    game by a draw rule (e.g. fifty_move_rule while in check).
+
+    The booleans are still accepted as input (folded into flags/status)
+    and serialized as computed fields, so dumps keep their original keys.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    flags: int = 0
     new_fen: Optional[str] = None
     san: Optional[str] = None
     uci: Optional[str] = None
     error: Optional[str] = None
-    is_capture: bool = False
-    is_check: bool = False
-    is_checkmate: bool = False
+    status: GameStatusType = ONGOING  # Status of the position after the move
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_flags(cls, data: Any) -> Any:
+        """Fold the boolean inputs into flags and status, keeping them consistent."""
+        if isinstance(data, dict) and not _MOVE_RESULT_INPUTS.isdisjoint(data):
+            data = dict(data)
+            flags = data.get("flags", 0)
+            for name, bit in _MOVE_RESULT_FLAGS.items():
+                if data.pop(name, False):
+                    flags |= bit
+            if data.pop("is_checkmate", False):
+                data["status"] = CHECKMATE
+            if data.get("status") in (CHECK, CHECKMATE):
+                flags |= FLAG_CHECK
+            data["flags"] = flags
+        return data
+
+    @computed_field
+    @property
+    def success(self) -> bool:
+        return bool(self.flags & FLAG_SUCCESS)
+
+    @computed_field
+    @property
+    def is_capture(self) -> bool:
+        return bool(self.flags & FLAG_CAPTURE)
+
+    @computed_field
+    @property
+    def is_check(self) -> bool:
+        return bool(self.flags & FLAG_CHECK)
+
+    @computed_field
+    @property
+    def is_checkmate(self) -> bool:
+        return self.status == CHECKMATE
 
 
-class GameStatus(BaseModel):
+class GameStatus(SchemaModel):
     """Current game status."""
+    model_config = ConfigDict(frozen=True)
+
     status: GameStatusType
     turn: str
     is_game_over: bool
@@ -55,116 +170,175 @@ class GameStatus(BaseModel):
     halfmove_clock: int = 0
 
 
-class LineAnalysis(BaseModel):
+class LineAnalysis(SchemaModel):
     """Analysis of a single variation line."""
+    model_config = ConfigDict(frozen=True)
+
     move: str
     move_san: Optional[str] = None
     centipawn: Optional[int] = None
     mate_in: Optional[int] = None
-    pv: list[str] = Field(default_factory=list)
-    pv_san: list[str] = Field(default_factory=list)
+    pv: tuple[str, ...] = ()
+    pv_san: tuple[str, ...] = ()
 
     @property
     def eval_string(self) -> str:
+        """Human-readable evaluation."""
         if self.mate_in is not None:
-            return f"M{self.mate_in}" if self.mate_in > 0 else f"-M{abs(self.mate_in)}"
+            return _format_mate(self.mate_in)
         if self.centipawn is not None:
-            return f"{self.centipawn / 100:+.2f}"
+            return _format_pawns(self.centipawn / 100)
         return "?"
 
 
-class PositionAnalysis(BaseModel):
-    """Full analysis of a position."""
+# Boolean inputs PositionAnalysis folds into status
+_POSITION_STATUS_FLAGS = {"is_checkmate": CHECKMATE, "is_stalemate": STALEMATE}
+
+
+class PositionAnalysis(SchemaModel):
+    """
+    Full analysis of a position.
+
+    is_check is stored separately from status since a position can be in
+    check and drawn by rule at once; is_checkmate and is_stalemate are
+    accepted as input (folded into status) and serialized as computed fields.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     fen: str
     depth: int
-    lines: list[LineAnalysis] = Field(default_factory=list)
+    lines: tuple[LineAnalysis, ...] = ()
     best_move: str
     best_move_san: Optional[str] = None
     evaluation: Optional[float] = None
     mate_in: Optional[int] = None
     is_check: bool = False
-    is_checkmate: bool = False
-    is_stalemate: bool = False
+    status: GameStatusType = ONGOING
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fold_status(cls, data: Any) -> Any:
+        """Fold is_checkmate/is_stalemate inputs into status; mate implies check."""
+        if isinstance(data, dict) and (
+            not _POSITION_STATUS_FLAGS.keys().isdisjoint(data) or "status" in data
+        ):
+            data = dict(data)
+            for name, status in _POSITION_STATUS_FLAGS.items():
+                if data.pop(name, False):
+                    data["status"] = status
+            # Checkmate is also check, as with chess.Board.is_check()
+            if data.get("status") in (CHECK, CHECKMATE):
+                data["is_check"] = True
+        return data
+
+    @computed_field
+    @property
+    def is_checkmate(self) -> bool:
+        return self.status == CHECKMATE
+
+    @computed_field
+    @property
+    def is_stalemate(self) -> bool:
+        return self.status == STALEMATE
 
     @property
     def eval_string(self) -> str:
+        """Human-readable evaluation."""
         if self.mate_in is not None:
-            return f"M{self.mate_in}" if self.mate_in > 0 else f"-M{abs(self.mate_in)}"
+            return _format_mate(self.mate_in)
         if self.evaluation is not None:
-            return f"{self.evaluation:+.2f}"
+            return _format_pawns(self.evaluation)
         return "?"
 
 
-class MoveEvaluation(BaseModel):
+class MoveEvaluation(SchemaModel):
     """Evaluation of a specific move."""
     move: str
     move_san: Optional[str] = None
     prev_eval: Optional[float] = None
     new_eval: Optional[float] = None
     delta: Optional[float] = None
-    classification: MoveClassification = MoveClassification.GOOD
+    classification: MoveClassification = GOOD
     best_move: Optional[str] = None
     best_move_san: Optional[str] = None
     explanation: str = ""
 
+    @property
+    def label(self) -> str:
+        """Display label for the classification."""
+        return CLASSIFICATION_LABELS[self.classification]
+
 
 # ============================================================================
 # Tutor Plan Schema (LLM Output)
 # ============================================================================
 
-class TutorPlan(BaseModel):
+# Example response embedded in the TutorPlan JSON schema; built once at import
+_TUTOR_PLAN_EXAMPLE = {
+    "opponent_reply": "c5",
+    "user_candidates": ["Nf3", "d4", "Bc4"],
+    "explain": "You played the classic King's Pawn opening (1.e4). "
+               "This controls the center and opens lines for your bishop and queen. "
+               "I'll respond with the Sicilian Defense (1...c5), the most popular "
+               "response at the top level. The engine evaluates this as roughly equal.",
+    "ask_user": "Do you prefer sharp tactical battles or quieter positional play?",
+    "move_evaluation": "good",
+    "grounding_citations": [
+        "analyze_position: eval +0.32, depth 15",
+        "analyze_position: top moves Nf3 (+0.35), d4 (+0.30), Nc3 (+0.28)"
+    ]
+}
+
+# Field descriptions only matter to schema generation, so they are merged
+# into the generated schema instead of building a Field() per attribute
+_TUTOR_PLAN_DESCRIPTIONS = {
+    "opponent_reply": "The tutor's reply move in SAN notation (e.g., 'c5', 'Nf6'). "
+                      "None if waiting for user or game is over.",
+    "user_candidates": "Suggested candidate moves for the user to consider, in SAN notation.",
+    "explain": "Explanation of the position, the user's move quality, "
+               "and strategic ideas. MUST cite engine analysis.",
+    "ask_user": "Optional question to engage the user (e.g., 'Do you prefer "
+                "sharp tactical play or solid positional play?')",
+    "move_evaluation": "Classification of the user's last move.",
+    "grounding_citations": "REQUIRED: Citations from tool outputs that ground the explanation. "
+                           "Format: 'tool_name: relevant_data' (e.g., 'analyze_position: eval +0.32, best Nf3')",
+    "mode": "Whether this turn was a move or a chat message. "
+            "Set by the orchestrator, not the LLM.",
+}
+
+
+def _tutor_plan_schema_extra(schema: dict) -> None:
+    """Add field descriptions and the example response to TutorPlan's schema."""
+    for name, prop in schema["properties"].items():
+        prop["description"] = _TUTOR_PLAN_DESCRIPTIONS[name]
+    schema["examples"] = [_TUTOR_PLAN_EXAMPLE]
+
+
+class TutorPlan(SchemaModel):
     """
     Structured output from the tutor LLM.
 
     This is the main response schema that the LLM produces after analyzing
     the user's move and position. It must include grounding citations.
     """
-    opponent_reply: Optional[str] = Field(
-        None,
-        description="The tutor's reply move in SAN notation (e.g., 'c5', 'Nf6'). "
-                    "None if waiting for user or game is over."
-    )
-    user_candidates: list[str] = Field(
-        default_factory=list,
-        description="Suggested candidate moves for the user to consider, in SAN notation."
-    )
-    explain: str = Field(
-        ...,
-        description="Explanation of the position, the user's move quality, "
-                    "and strategic ideas. MUST cite engine analysis."
-    )
-    ask_user: Optional[str] = Field(
-        None,
-        description="Optional question to engage the user (e.g., 'Do you prefer "
-                    "sharp tactical play or solid positional play?')"
-    )
-    move_evaluation: MoveClassification = Field(
-        MoveClassification.GOOD,
-        description="Classification of the user's last move."
-    )
-    grounding_citations: list[str] = Field(
-        default_factory=list,
-        description="REQUIRED: Citations from tool outputs that ground the explanation. "
-                    "Format: 'tool_name: relevant_data' (e.g., 'analyze_position: eval +0.32, best Nf3')"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "opponent_reply": "c5",
-                    "user_candidates": ["Nf3", "d4", "Bc4"],
-                    "explain": "You played the classic King's Pawn opening (1.e4). "
-                               "This controls the center and opens lines for your bishop and queen. "
-                               "I'll respond with the Sicilian Defense (1...c5), the most popular "
-                               "response at the top level. The engine evaluates this as roughly equal.",
-                    "ask_user": "Do you prefer sharp tactical battles or quieter positional play?",
-                    "move_evaluation": "good",
-                    "grounding_citations": [
-                        "analyze_position: eval +0.32, depth 15",
-                        "analyze_position: top moves Nf3 (+0.35), d4 (+0.30), Nc3 (+0.28)"
-                    ]
-                }
-            ]
-        }
-    }
+    opponent_reply: Optional[str] = None
+    user_candidates: tuple[str, ...] = ()
+    explain: str
+    ask_user: Optional[str] = None
+    move_evaluation: MoveClassification = GOOD
+    grounding_citations: tuple[str, ...] = ()
+    mode: Literal["move", "chat"] = "chat"
+
+    model_config = ConfigDict(json_schema_extra=_tutor_plan_schema_extra)
+
+    @field_validator("user_candidates", "grounding_citations")
+    @classmethod
+    def _intern_strings(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        """Share the SAN moves and citations that repeat across a session's plans."""
+        return tuple(map(sys.intern, value))
+
+
+# Generate each model's JSON schema once at import (see SchemaModel)
+for _model in (MoveResult, GameStatus, LineAnalysis, PositionAnalysis, MoveEvaluation, TutorPlan):
+    _model.JSON_SCHEMA = MappingProxyType(_model.model_json_schema())
+del _model